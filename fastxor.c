@@ -4,139 +4,938 @@
 #include <stdlib.h>
 
 /*
- * Fast 64-bit XOR function for byte objects
- * Takes two bytes objects and returns their XOR result
+ * On x86 with GCC/clang every SIMD kernel is compiled for its own ISA via
+ * target attributes and picked at import time with CPUID, so one binary runs
+ * on any x86 CPU without -march=native. On ARM the NEON kernel is used when
+ * the compiler targets NEON (always the case on aarch64 / Apple Silicon).
+ * Other platforms use the scalar kernel.
  */
-static PyObject* fast_xor64(PyObject* self, PyObject* args) {
-    PyObject *bytes1, *bytes2;
-    
-    // Parse arguments - expecting two bytes objects
-    if (!PyArg_ParseTuple(args, "SS", &bytes1, &bytes2)) {
-        return NULL;
+#if (defined(__x86_64__) || defined(__i386__)) && (defined(__GNUC__) || defined(__clang__))
+#define FASTXOR_X86_DISPATCH 1
+#include <immintrin.h>
+#elif defined(__ARM_NEON) || defined(__ARM_NEON__)
+#define FASTXOR_NEON 1
+#include <arm_neon.h>
+#endif
+
+typedef void (*xor_kernel_fn)(char* out, const char* a, const char* b, size_t n);
+
+/*
+ * SWAR XOR of bytes [i, n): 64-bit words, then one 32-bit word, then bytes
+ * memcpy keeps this free of alignment/aliasing UB and compiles to plain
+ * (unaligned where the target allows) moves. Serves as the whole portable
+ * kernel and as the tail of every SIMD kernel.
+ */
+static inline void xor_swar(char* out, const char* a, const char* b, size_t i, size_t n) {
+    for (; i + 8 <= n; i += 8) {
+        uint64_t x, y;
+        memcpy(&x, a + i, 8);
+        memcpy(&y, b + i, 8);
+        x ^= y;
+        memcpy(out + i, &x, 8);
     }
-    
-    // Get data pointers and sizes
-    Py_ssize_t size1 = PyBytes_Size(bytes1);
-    Py_ssize_t size2 = PyBytes_Size(bytes2);
 
-    /* Acquire raw pointers; PyBytes_AsString can return NULL on failure */
-    const char* data1 = PyBytes_AsString(bytes1);
-    if (!data1) {
-        /* Propagate the Python error already set */
-        return NULL;
+    if (i + 4 <= n) {
+        uint32_t x, y;
+        memcpy(&x, a + i, 4);
+        memcpy(&y, b + i, 4);
+        x ^= y;
+        memcpy(out + i, &x, 4);
+        i += 4;
     }
-    const char* data2 = PyBytes_AsString(bytes2);
-    if (!data2) {
-        return NULL;
+
+    for (; i < n; i++) {
+        out[i] = a[i] ^ b[i];
+    }
+}
+
+/* Portable kernel for platforms without a SIMD path: writes n bytes of a ^ b into out */
+static void xor_kernel_scalar(char* out, const char* a, const char* b, size_t n) {
+    xor_swar(out, a, b, 0, n);
+}
+
+/*
+ * Buffers at least this large are written with non-temporal (streaming)
+ * stores on x86. Such outputs won't be re-read from cache soon, and streaming
+ * skips the read-for-ownership of each output line, roughly halving write
+ * traffic. Overridable at import time with the FASTXOR_NT_THRESHOLD
+ * environment variable (in bytes).
+ */
+#define FASTXOR_NT_THRESHOLD ((size_t)8 << 20)
+static size_t xor_nt_threshold = FASTXOR_NT_THRESHOLD;
+
+#ifdef FASTXOR_X86_DISPATCH
+/*
+ * The 256-bit and 128-bit kernels use the float-domain xorps forms, which only
+ * need AVX / SSE, so AVX-only CPUs (Sandy/Ivy Bridge) still get 32-byte steps.
+ * XOR is bitwise, so the float casts never alter the data.
+ *
+ * Streaming stores are weakly ordered; each kernel ends its streaming loop
+ * with _mm_sfence() so the result is visible to other threads on return.
+ */
+
+/*
+ * Software prefetch for buffers too long to stay in L2: each step requests
+ * the input lines FASTXOR_PREFETCH_DISTANCE bytes ahead so DRAM latency
+ * overlaps with the XOR. Streaming loops use the NTA hint to avoid
+ * polluting the cache, matching their non-temporal stores.
+ */
+#define FASTXOR_PREFETCH_DISTANCE 512
+#define FASTXOR_PREFETCH_MIN 4096
+
+/* Offset below which a step of the given size may prefetch without reading past the inputs */
+static inline size_t xor_prefetch_end(size_t n, size_t step) {
+    return n > FASTXOR_PREFETCH_MIN ? n - FASTXOR_PREFETCH_DISTANCE - step : 0;
+}
+
+/* Bytes to process before out reaches an align-byte boundary, capped at n */
+static inline size_t xor_align_head(const char* out, size_t align, size_t n) {
+    size_t head = (align - ((uintptr_t)out & (align - 1))) & (align - 1);
+    return head < n ? head : n;
+}
+
+/* 16 bytes per step with SSE1 loads/stores only */
+__attribute__((target("sse")))
+static void xor_kernel_sse(char* out, const char* a, const char* b, size_t n) {
+    size_t i = 0;
+
+    if (n >= xor_nt_threshold) {
+        /* _mm_stream_ps needs a 16-byte aligned destination */
+        i = xor_align_head(out, 16, n);
+        xor_swar(out, a, b, 0, i);
+        for (; i + 16 <= n; i += 16) {
+            __m128 va = _mm_loadu_ps((const float*)(a + i));
+            __m128 vb = _mm_loadu_ps((const float*)(b + i));
+            _mm_stream_ps((float*)(out + i), _mm_xor_ps(va, vb));
+        }
+        _mm_sfence();
+    }
+
+    for (; i + 16 <= n; i += 16) {
+        __m128 va = _mm_loadu_ps((const float*)(a + i));
+        __m128 vb = _mm_loadu_ps((const float*)(b + i));
+        _mm_storeu_ps((float*)(out + i), _mm_xor_ps(va, vb));
+    }
+
+    xor_swar(out, a, b, i, n);
+}
+
+/*
+ * The AVX and AVX-512 main loops are unrolled 4x with independent registers,
+ * so the four load-xor-store chains per step can issue in parallel on the
+ * CPU's load/store ports instead of serializing on load latency.
+ */
+
+/* 128 bytes per step (4 x 32), then 32-byte steps */
+__attribute__((target("avx")))
+static void xor_kernel_avx(char* out, const char* a, const char* b, size_t n) {
+    size_t i = 0;
+    size_t pf_end = xor_prefetch_end(n, 128);
+
+    if (n >= xor_nt_threshold) {
+        /* _mm256_stream_ps needs a 32-byte aligned destination */
+        i = xor_align_head(out, 32, n);
+        xor_swar(out, a, b, 0, i);
+        for (; i + 128 <= n; i += 128) {
+            if (i < pf_end) {
+                _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE, _MM_HINT_NTA);
+                _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE + 64, _MM_HINT_NTA);
+                _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE, _MM_HINT_NTA);
+                _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE + 64, _MM_HINT_NTA);
+            }
+            __m256 a0 = _mm256_loadu_ps((const float*)(a + i));
+            __m256 a1 = _mm256_loadu_ps((const float*)(a + i + 32));
+            __m256 a2 = _mm256_loadu_ps((const float*)(a + i + 64));
+            __m256 a3 = _mm256_loadu_ps((const float*)(a + i + 96));
+            __m256 b0 = _mm256_loadu_ps((const float*)(b + i));
+            __m256 b1 = _mm256_loadu_ps((const float*)(b + i + 32));
+            __m256 b2 = _mm256_loadu_ps((const float*)(b + i + 64));
+            __m256 b3 = _mm256_loadu_ps((const float*)(b + i + 96));
+            _mm256_stream_ps((float*)(out + i), _mm256_xor_ps(a0, b0));
+            _mm256_stream_ps((float*)(out + i + 32), _mm256_xor_ps(a1, b1));
+            _mm256_stream_ps((float*)(out + i + 64), _mm256_xor_ps(a2, b2));
+            _mm256_stream_ps((float*)(out + i + 96), _mm256_xor_ps(a3, b3));
+        }
+        for (; i + 32 <= n; i += 32) {
+            __m256 va = _mm256_loadu_ps((const float*)(a + i));
+            __m256 vb = _mm256_loadu_ps((const float*)(b + i));
+            _mm256_stream_ps((float*)(out + i), _mm256_xor_ps(va, vb));
+        }
+        _mm_sfence();
+    }
+
+    for (; i + 128 <= n; i += 128) {
+        if (i < pf_end) {
+            _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE, _MM_HINT_T0);
+            _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE + 64, _MM_HINT_T0);
+            _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE, _MM_HINT_T0);
+            _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE + 64, _MM_HINT_T0);
+        }
+        __m256 a0 = _mm256_loadu_ps((const float*)(a + i));
+        __m256 a1 = _mm256_loadu_ps((const float*)(a + i + 32));
+        __m256 a2 = _mm256_loadu_ps((const float*)(a + i + 64));
+        __m256 a3 = _mm256_loadu_ps((const float*)(a + i + 96));
+        __m256 b0 = _mm256_loadu_ps((const float*)(b + i));
+        __m256 b1 = _mm256_loadu_ps((const float*)(b + i + 32));
+        __m256 b2 = _mm256_loadu_ps((const float*)(b + i + 64));
+        __m256 b3 = _mm256_loadu_ps((const float*)(b + i + 96));
+        _mm256_storeu_ps((float*)(out + i), _mm256_xor_ps(a0, b0));
+        _mm256_storeu_ps((float*)(out + i + 32), _mm256_xor_ps(a1, b1));
+        _mm256_storeu_ps((float*)(out + i + 64), _mm256_xor_ps(a2, b2));
+        _mm256_storeu_ps((float*)(out + i + 96), _mm256_xor_ps(a3, b3));
+    }
+
+    for (; i + 32 <= n; i += 32) {
+        __m256 va = _mm256_loadu_ps((const float*)(a + i));
+        __m256 vb = _mm256_loadu_ps((const float*)(b + i));
+        _mm256_storeu_ps((float*)(out + i), _mm256_xor_ps(va, vb));
+    }
+
+    xor_swar(out, a, b, i, n);
+}
+
+/*
+ * 256 bytes per step (4 x 64), then 64-byte steps; returns the offset of
+ * the <64 byte remainder. Shared by both AVX-512 kernels, which differ only
+ * in how they finish the tail. _mm512_xor_si512 is AVX512F, the ps form
+ * would need DQ.
+ */
+__attribute__((target("avx512f"), always_inline))
+static inline size_t xor_avx512_body(char* out, const char* a, const char* b, size_t n) {
+    size_t i = 0;
+    size_t pf_end = xor_prefetch_end(n, 256);
+
+    if (n >= xor_nt_threshold) {
+        /* _mm512_stream_si512 needs a 64-byte aligned destination */
+        i = xor_align_head(out, 64, n);
+        xor_swar(out, a, b, 0, i);
+        for (; i + 256 <= n; i += 256) {
+            if (i < pf_end) {
+                for (size_t line = 0; line < 256; line += 64) {
+                    _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE + line, _MM_HINT_NTA);
+                    _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE + line, _MM_HINT_NTA);
+                }
+            }
+            __m512i a0 = _mm512_loadu_si512((const void*)(a + i));
+            __m512i a1 = _mm512_loadu_si512((const void*)(a + i + 64));
+            __m512i a2 = _mm512_loadu_si512((const void*)(a + i + 128));
+            __m512i a3 = _mm512_loadu_si512((const void*)(a + i + 192));
+            __m512i b0 = _mm512_loadu_si512((const void*)(b + i));
+            __m512i b1 = _mm512_loadu_si512((const void*)(b + i + 64));
+            __m512i b2 = _mm512_loadu_si512((const void*)(b + i + 128));
+            __m512i b3 = _mm512_loadu_si512((const void*)(b + i + 192));
+            _mm512_stream_si512((void*)(out + i), _mm512_xor_si512(a0, b0));
+            _mm512_stream_si512((void*)(out + i + 64), _mm512_xor_si512(a1, b1));
+            _mm512_stream_si512((void*)(out + i + 128), _mm512_xor_si512(a2, b2));
+            _mm512_stream_si512((void*)(out + i + 192), _mm512_xor_si512(a3, b3));
+        }
+        for (; i + 64 <= n; i += 64) {
+            __m512i va = _mm512_loadu_si512((const void*)(a + i));
+            __m512i vb = _mm512_loadu_si512((const void*)(b + i));
+            _mm512_stream_si512((void*)(out + i), _mm512_xor_si512(va, vb));
+        }
+        _mm_sfence();
+    }
+
+    for (; i + 256 <= n; i += 256) {
+        if (i < pf_end) {
+            for (size_t line = 0; line < 256; line += 64) {
+                _mm_prefetch(a + i + FASTXOR_PREFETCH_DISTANCE + line, _MM_HINT_T0);
+                _mm_prefetch(b + i + FASTXOR_PREFETCH_DISTANCE + line, _MM_HINT_T0);
+            }
+        }
+        __m512i a0 = _mm512_loadu_si512((const void*)(a + i));
+        __m512i a1 = _mm512_loadu_si512((const void*)(a + i + 64));
+        __m512i a2 = _mm512_loadu_si512((const void*)(a + i + 128));
+        __m512i a3 = _mm512_loadu_si512((const void*)(a + i + 192));
+        __m512i b0 = _mm512_loadu_si512((const void*)(b + i));
+        __m512i b1 = _mm512_loadu_si512((const void*)(b + i + 64));
+        __m512i b2 = _mm512_loadu_si512((const void*)(b + i + 128));
+        __m512i b3 = _mm512_loadu_si512((const void*)(b + i + 192));
+        _mm512_storeu_si512((void*)(out + i), _mm512_xor_si512(a0, b0));
+        _mm512_storeu_si512((void*)(out + i + 64), _mm512_xor_si512(a1, b1));
+        _mm512_storeu_si512((void*)(out + i + 128), _mm512_xor_si512(a2, b2));
+        _mm512_storeu_si512((void*)(out + i + 192), _mm512_xor_si512(a3, b3));
+    }
+
+    for (; i + 64 <= n; i += 64) {
+        __m512i va = _mm512_loadu_si512((const void*)(a + i));
+        __m512i vb = _mm512_loadu_si512((const void*)(b + i));
+        _mm512_storeu_si512((void*)(out + i), _mm512_xor_si512(va, vb));
+    }
+
+    return i;
+}
+
+/* AVX512F only: one 32-byte step, then the SWAR tail */
+__attribute__((target("avx512f")))
+static void xor_kernel_avx512f(char* out, const char* a, const char* b, size_t n) {
+    size_t i = xor_avx512_body(out, a, b, n);
+
+    /* One 32-byte step covers the upper half of the <64 byte remainder */
+    if (i + 32 <= n) {
+        __m256 va = _mm256_loadu_ps((const float*)(a + i));
+        __m256 vb = _mm256_loadu_ps((const float*)(b + i));
+        _mm256_storeu_ps((float*)(out + i), _mm256_xor_ps(va, vb));
+        i += 32;
+    }
+
+    xor_swar(out, a, b, i, n);
+}
+
+/*
+ * AVX512BW adds byte-granular masks, so the whole <64 byte remainder is a
+ * single masked load/xor/store. Masked-off bytes are neither read nor
+ * written, so this never touches memory past the buffers.
+ */
+__attribute__((target("avx512f,avx512bw")))
+static void xor_kernel_avx512bw(char* out, const char* a, const char* b, size_t n) {
+    size_t i = xor_avx512_body(out, a, b, n);
+
+    if (i < n) {
+        __mmask64 m = (1ULL << (n - i)) - 1;
+        __m512i va = _mm512_maskz_loadu_epi8(m, (const void*)(a + i));
+        __m512i vb = _mm512_maskz_loadu_epi8(m, (const void*)(b + i));
+        _mm512_mask_storeu_epi8((void*)(out + i), m, _mm512_xor_si512(va, vb));
+    }
+}
+#endif
+
+#ifdef FASTXOR_NEON
+/* 64 bytes per step as four independent 128-bit veorq_u8 ops, then 16 */
+static void xor_kernel_neon(char* out, const char* a, const char* b, size_t n) {
+    const uint8_t* pa = (const uint8_t*)a;
+    const uint8_t* pb = (const uint8_t*)b;
+    uint8_t* po = (uint8_t*)out;
+    size_t i = 0;
+
+    for (; i + 64 <= n; i += 64) {
+        uint8x16_t a0 = vld1q_u8(pa + i);
+        uint8x16_t a1 = vld1q_u8(pa + i + 16);
+        uint8x16_t a2 = vld1q_u8(pa + i + 32);
+        uint8x16_t a3 = vld1q_u8(pa + i + 48);
+        uint8x16_t b0 = vld1q_u8(pb + i);
+        uint8x16_t b1 = vld1q_u8(pb + i + 16);
+        uint8x16_t b2 = vld1q_u8(pb + i + 32);
+        uint8x16_t b3 = vld1q_u8(pb + i + 48);
+        vst1q_u8(po + i, veorq_u8(a0, b0));
+        vst1q_u8(po + i + 16, veorq_u8(a1, b1));
+        vst1q_u8(po + i + 32, veorq_u8(a2, b2));
+        vst1q_u8(po + i + 48, veorq_u8(a3, b3));
+    }
+
+    for (; i + 16 <= n; i += 16) {
+        vst1q_u8(po + i, veorq_u8(vld1q_u8(pa + i), vld1q_u8(pb + i)));
+    }
+
+    xor_swar(out, a, b, i, n);
+}
+#endif
+
+/*
+ * Repeating-key kernels: XOR data against a 64-byte key pattern, i.e. any key
+ * whose length divides 64 (websocket masks, 16/32/64-byte keys) tiled once.
+ * The pattern is loaded into registers before the loop, so each step reads
+ * only the data. Each writes n bytes of data ^ pattern[i % 64] into out.
+ */
+typedef void (*xor_key_kernel_fn)(char* out, const char* data, const char* pattern, size_t n);
+
+static void xor_key_kernel_scalar(char* out, const char* data, const char* pattern, size_t n) {
+    size_t i = 0;
+
+    for (; i + 64 <= n; i += 64) {
+        xor_swar(out + i, data + i, pattern, 0, 64);
+    }
+
+    xor_swar(out + i, data + i, pattern, 0, n - i);
+}
+
+#ifdef FASTXOR_X86_DISPATCH
+__attribute__((target("sse")))
+static void xor_key_kernel_sse(char* out, const char* data, const char* pattern, size_t n) {
+    __m128 p0 = _mm_loadu_ps((const float*)pattern);
+    __m128 p1 = _mm_loadu_ps((const float*)(pattern + 16));
+    __m128 p2 = _mm_loadu_ps((const float*)(pattern + 32));
+    __m128 p3 = _mm_loadu_ps((const float*)(pattern + 48));
+    size_t i = 0;
+
+    for (; i + 64 <= n; i += 64) {
+        _mm_storeu_ps((float*)(out + i), _mm_xor_ps(_mm_loadu_ps((const float*)(data + i)), p0));
+        _mm_storeu_ps((float*)(out + i + 16), _mm_xor_ps(_mm_loadu_ps((const float*)(data + i + 16)), p1));
+        _mm_storeu_ps((float*)(out + i + 32), _mm_xor_ps(_mm_loadu_ps((const float*)(data + i + 32)), p2));
+        _mm_storeu_ps((float*)(out + i + 48), _mm_xor_ps(_mm_loadu_ps((const float*)(data + i + 48)), p3));
+    }
+
+    xor_swar(out + i, data + i, pattern, 0, n - i);
+}
+
+__attribute__((target("avx")))
+static void xor_key_kernel_avx(char* out, const char* data, const char* pattern, size_t n) {
+    __m256 p0 = _mm256_loadu_ps((const float*)pattern);
+    __m256 p1 = _mm256_loadu_ps((const float*)(pattern + 32));
+    size_t i = 0;
+
+    for (; i + 128 <= n; i += 128) {
+        __m256 d0 = _mm256_loadu_ps((const float*)(data + i));
+        __m256 d1 = _mm256_loadu_ps((const float*)(data + i + 32));
+        __m256 d2 = _mm256_loadu_ps((const float*)(data + i + 64));
+        __m256 d3 = _mm256_loadu_ps((const float*)(data + i + 96));
+        _mm256_storeu_ps((float*)(out + i), _mm256_xor_ps(d0, p0));
+        _mm256_storeu_ps((float*)(out + i + 32), _mm256_xor_ps(d1, p1));
+        _mm256_storeu_ps((float*)(out + i + 64), _mm256_xor_ps(d2, p0));
+        _mm256_storeu_ps((float*)(out + i + 96), _mm256_xor_ps(d3, p1));
+    }
+
+    if (i + 64 <= n) {
+        _mm256_storeu_ps((float*)(out + i), _mm256_xor_ps(_mm256_loadu_ps((const float*)(data + i)), p0));
+        _mm256_storeu_ps((float*)(out + i + 32), _mm256_xor_ps(_mm256_loadu_ps((const float*)(data + i + 32)), p1));
+        i += 64;
+    }
+
+    xor_swar(out + i, data + i, pattern, 0, n - i);
+}
+
+/* Returns the offset of the <64 byte remainder, as xor_avx512_body() does */
+__attribute__((target("avx512f"), always_inline))
+static inline size_t xor_key_avx512_body(char* out, const char* data, __m512i p, size_t n) {
+    size_t i = 0;
+
+    for (; i + 256 <= n; i += 256) {
+        __m512i d0 = _mm512_loadu_si512((const void*)(data + i));
+        __m512i d1 = _mm512_loadu_si512((const void*)(data + i + 64));
+        __m512i d2 = _mm512_loadu_si512((const void*)(data + i + 128));
+        __m512i d3 = _mm512_loadu_si512((const void*)(data + i + 192));
+        _mm512_storeu_si512((void*)(out + i), _mm512_xor_si512(d0, p));
+        _mm512_storeu_si512((void*)(out + i + 64), _mm512_xor_si512(d1, p));
+        _mm512_storeu_si512((void*)(out + i + 128), _mm512_xor_si512(d2, p));
+        _mm512_storeu_si512((void*)(out + i + 192), _mm512_xor_si512(d3, p));
+    }
+
+    for (; i + 64 <= n; i += 64) {
+        _mm512_storeu_si512((void*)(out + i), _mm512_xor_si512(_mm512_loadu_si512((const void*)(data + i)), p));
+    }
+
+    return i;
+}
+
+__attribute__((target("avx512f")))
+static void xor_key_kernel_avx512f(char* out, const char* data, const char* pattern, size_t n) {
+    size_t i = xor_key_avx512_body(out, data, _mm512_loadu_si512((const void*)pattern), n);
+
+    xor_swar(out + i, data + i, pattern, 0, n - i);
+}
+
+/* i is a multiple of 64, so the tail lines up with the start of the pattern */
+__attribute__((target("avx512f,avx512bw")))
+static void xor_key_kernel_avx512bw(char* out, const char* data, const char* pattern, size_t n) {
+    __m512i p = _mm512_loadu_si512((const void*)pattern);
+    size_t i = xor_key_avx512_body(out, data, p, n);
+
+    if (i < n) {
+        __mmask64 m = (1ULL << (n - i)) - 1;
+        __m512i vd = _mm512_maskz_loadu_epi8(m, (const void*)(data + i));
+        _mm512_mask_storeu_epi8((void*)(out + i), m, _mm512_xor_si512(vd, p));
+    }
+}
+#endif
+
+#ifdef FASTXOR_NEON
+static void xor_key_kernel_neon(char* out, const char* data, const char* pattern, size_t n) {
+    const uint8_t* pd = (const uint8_t*)data;
+    uint8_t* po = (uint8_t*)out;
+    uint8x16_t p0 = vld1q_u8((const uint8_t*)pattern);
+    uint8x16_t p1 = vld1q_u8((const uint8_t*)pattern + 16);
+    uint8x16_t p2 = vld1q_u8((const uint8_t*)pattern + 32);
+    uint8x16_t p3 = vld1q_u8((const uint8_t*)pattern + 48);
+    size_t i = 0;
+
+    for (; i + 64 <= n; i += 64) {
+        vst1q_u8(po + i, veorq_u8(vld1q_u8(pd + i), p0));
+        vst1q_u8(po + i + 16, veorq_u8(vld1q_u8(pd + i + 16), p1));
+        vst1q_u8(po + i + 32, veorq_u8(vld1q_u8(pd + i + 32), p2));
+        vst1q_u8(po + i + 48, veorq_u8(vld1q_u8(pd + i + 48), p3));
+    }
+
+    xor_swar(out + i, data + i, pattern, 0, n - i);
+}
+#endif
+
+/* Kernels used by all entry points; chosen once by select_xor_kernel() */
+static xor_kernel_fn xor_kernel = xor_kernel_scalar;
+static xor_key_kernel_fn xor_key_kernel = xor_key_kernel_scalar;
+static const char* xor_kernel_name = "scalar";
+
+/*
+ * Pick the widest kernel the running CPU supports
+ * Called once from module init so the per-call cost is a single indirect call
+ */
+static void select_xor_kernel(void) {
+#ifdef FASTXOR_X86_DISPATCH
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("avx512f") && __builtin_cpu_supports("avx512bw")) {
+        xor_kernel = xor_kernel_avx512bw;
+        xor_key_kernel = xor_key_kernel_avx512bw;
+        xor_kernel_name = "avx512bw";
+    } else if (__builtin_cpu_supports("avx512f")) {
+        xor_kernel = xor_kernel_avx512f;
+        xor_key_kernel = xor_key_kernel_avx512f;
+        xor_kernel_name = "avx512f";
+    } else if (__builtin_cpu_supports("avx")) {
+        xor_kernel = xor_kernel_avx;
+        xor_key_kernel = xor_key_kernel_avx;
+        xor_kernel_name = "avx";
+    } else if (__builtin_cpu_supports("sse")) {
+        xor_kernel = xor_kernel_sse;
+        xor_key_kernel = xor_key_kernel_sse;
+        xor_kernel_name = "sse";
+    }
+#elif defined(FASTXOR_NEON)
+    xor_kernel = xor_kernel_neon;
+    xor_key_kernel = xor_key_kernel_neon;
+    xor_kernel_name = "neon";
+#endif
+
+    const char* nt_env = getenv("FASTXOR_NT_THRESHOLD");
+    if (nt_env && *nt_env) {
+        char* end;
+        unsigned long long value = strtoull(nt_env, &end, 10);
+        if (*end == '\0') {
+            xor_nt_threshold = (size_t)value;
+        }
+    }
+}
+
+/*
+ * Buffers at least this large are XORed with the GIL released, so threads
+ * working on independent data run in parallel. Below it the save/restore
+ * of the thread state costs more than the XOR itself.
+ */
+#define FASTXOR_NOGIL_THRESHOLD 4096
+
+/*
+ * Run the selected kernel, releasing the GIL for large buffers
+ * Callers must keep the input and output objects alive; no Python API is
+ * used inside the unlocked region.
+ */
+static void run_xor_kernel(char* out, const char* a, const char* b, size_t n) {
+    if (n >= FASTXOR_NOGIL_THRESHOLD) {
+        Py_BEGIN_ALLOW_THREADS
+        xor_kernel(out, a, b, n);
+        Py_END_ALLOW_THREADS
+    } else {
+        xor_kernel(out, a, b, n);
+    }
+}
+
+/*
+ * Block size for xor_reduce(): each output block is folded against every
+ * input while it is still in L1, so the output makes one trip to memory
+ * however many buffers are combined.
+ */
+#define FASTXOR_REDUCE_BLOCK 4096
+
+/*
+ * Fold count equal-length buffers into out, one cache-sized block at a time
+ * The kernels read each position before writing it, so out may alias a source.
+ */
+static void xor_reduce_kernel(char* out, const char* const* srcs, Py_ssize_t count, size_t n) {
+    if (count == 1) {
+        memcpy(out, srcs[0], n);
+        return;
+    }
+
+    for (size_t off = 0; off < n; off += FASTXOR_REDUCE_BLOCK) {
+        size_t len = n - off < FASTXOR_REDUCE_BLOCK ? n - off : FASTXOR_REDUCE_BLOCK;
+        xor_kernel(out + off, srcs[0] + off, srcs[1] + off, len);
+        for (Py_ssize_t j = 2; j < count; j++) {
+            xor_kernel(out + off, out + off, srcs[j] + off, len);
+        }
+    }
+}
+
+/*
+ * Block size for xor_key() with keys whose length doesn't divide 64: the key
+ * is tiled into a block holding a whole number of key periods (about this
+ * size) and the regular kernel runs block by block, with the block kept in L1.
+ */
+#define FASTXOR_KEY_BLOCK 4096
+
+/* Fill len bytes of dst with the key repeated */
+static void xor_tile_key(char* dst, size_t len, const char* key, size_t key_len) {
+    for (size_t off = 0; off < len; off += key_len) {
+        memcpy(dst + off, key, len - off < key_len ? len - off : key_len);
     }
+}
+
+/* XOR data against a tiled key block of block_len bytes, repeated */
+static void xor_key_blocks(char* out, const char* data, size_t n, const char* block, size_t block_len) {
+    for (size_t off = 0; off < n; off += block_len) {
+        xor_kernel(out + off, data + off, block, n - off < block_len ? n - off : block_len);
+    }
+}
+
+/*
+ * XOR function that handles any size data; also exported as xor64()
+ * Runs the CPU-selected kernel: unrolled vector body, then a SWAR or masked tail
+ *
+ * METH_FASTCALL: the arguments arrive as a C array, so there is no tuple to
+ * build and no format string to interpret. That per-call cost is a large
+ * share of small-chunk calls, where the XOR itself takes a few nanoseconds.
+ */
+static PyObject* flexible_xor(PyObject* self, PyObject* const* args, Py_ssize_t nargs) {
+    Py_buffer buf1, buf2;
+    PyObject* result_bytes = NULL;
     
-    // Validate input sizes
-    if (size1 != size2) {
-        PyErr_SetString(PyExc_ValueError, "Byte objects must have the same length");
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "expected 2 arguments, got %zd", nargs);
         return NULL;
     }
     
-    if (size1 < 8) {
-        PyErr_SetString(PyExc_ValueError, "Input data must be at least 64 bits (8 bytes)");
+    /* PyBUF_SIMPLE requests a C-contiguous view, as the "y*" format does */
+    if (PyObject_GetBuffer(args[0], &buf1, PyBUF_SIMPLE) < 0) {
         return NULL;
     }
-    
-    if (size1 % 8 != 0) {
-        PyErr_SetString(PyExc_ValueError, "Input data length must be a multiple of 8 bytes");
+    if (PyObject_GetBuffer(args[1], &buf2, PyBUF_SIMPLE) < 0) {
+        PyBuffer_Release(&buf1);
         return NULL;
     }
     
-    /* Convert to size_t to avoid signed/unsigned mismatch and potential overflow */
-    if (size1 < 0) {
-        PyErr_SetString(PyExc_OverflowError, "Negative size encountered");
-        return NULL;
+    if (buf1.len != buf2.len) {
+        PyErr_SetString(PyExc_ValueError, "Input buffers must have the same length");
+        goto done;
     }
-    size_t alloc_size = (size_t)size1;
+    
+    result_bytes = PyBytes_FromStringAndSize(NULL, buf1.len);
+    if (!result_bytes) {
+        goto done;
+    }
+    
+    run_xor_kernel(PyBytes_AS_STRING(result_bytes), buf1.buf, buf2.buf, (size_t)buf1.len);
+    
+done:
+    PyBuffer_Release(&buf1);
+    PyBuffer_Release(&buf2);
+    return result_bytes;
+}
 
-    /* Allocate result buffer using CPython allocator for better tracking */
-    char* result = (char*)PyMem_Malloc(alloc_size);
-    if (!result) {
-        PyErr_SetString(PyExc_MemoryError, "Failed to allocate memory for result");
+/*
+ * Batched XOR over a whole buffer split into fixed-size chunks
+ * Equivalent to joining xor() over every chunk, but runs a single C loop
+ */
+static PyObject* xor_many(PyObject* self, PyObject* args) {
+    Py_buffer buf1, buf2;
+    Py_ssize_t chunk_size;
+    PyObject* result_bytes = NULL;
+    
+    if (!PyArg_ParseTuple(args, "y*y*n", &buf1, &buf2, &chunk_size)) {
         return NULL;
     }
     
-    /* Perform XOR safely byte-by-byte to avoid alignment and aliasing UB */
-    for (Py_ssize_t i = 0; i < size1; i++) {
-        result[i] = data1[i] ^ data2[i];
+    if (buf1.len != buf2.len) {
+        PyErr_SetString(PyExc_ValueError, "Input buffers must have the same length");
+        goto done;
     }
     
-    // Create Python bytes object from result
-    PyObject* result_bytes = PyBytes_FromStringAndSize(result, size1);
-    PyMem_Free(result);
+    if (chunk_size < 1) {
+        PyErr_SetString(PyExc_ValueError, "Chunk size must be positive");
+        goto done;
+    }
     
+    if (buf1.len % chunk_size != 0) {
+        PyErr_SetString(PyExc_ValueError, "Input data length must be a multiple of the chunk size");
+        goto done;
+    }
+    
+    result_bytes = PyBytes_FromStringAndSize(NULL, buf1.len);
     if (!result_bytes) {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to create result bytes object");
-        return NULL;
+        goto done;
     }
     
+    run_xor_kernel(PyBytes_AS_STRING(result_bytes), buf1.buf, buf2.buf, (size_t)buf1.len);
+    
+done:
+    PyBuffer_Release(&buf1);
+    PyBuffer_Release(&buf2);
     return result_bytes;
 }
 
 /*
- * Flexible XOR function that handles any size data
- * Processes 64-bit chunks when possible, falls back to byte-wise for remainder
+ * In-place XOR into a caller-supplied writable buffer
+ * Lets chunked callers reuse one output buffer instead of allocating per call
  */
-static PyObject* flexible_xor(PyObject* self, PyObject* args) {
-    PyObject *bytes1, *bytes2;
+static PyObject* xor_into(PyObject* self, PyObject* args) {
+    Py_buffer out_buf, buf1, buf2;
+    PyObject* result = NULL;
     
-    if (!PyArg_ParseTuple(args, "SS", &bytes1, &bytes2)) {
+    /* "w*" rejects read-only objects such as bytes with a TypeError */
+    if (!PyArg_ParseTuple(args, "w*y*y*", &out_buf, &buf1, &buf2)) {
         return NULL;
     }
     
-    Py_ssize_t size1 = PyBytes_Size(bytes1);
-    Py_ssize_t size2 = PyBytes_Size(bytes2);
+    if (buf1.len != buf2.len) {
+        PyErr_SetString(PyExc_ValueError, "Input buffers must have the same length");
+        goto done;
+    }
+    
+    if (out_buf.len != buf1.len) {
+        PyErr_SetString(PyExc_ValueError, "Output buffer must have the same length as the inputs");
+        goto done;
+    }
+    
+    run_xor_kernel((char*)out_buf.buf, buf1.buf, buf2.buf, (size_t)buf1.len);
+    result = Py_None;
+    Py_INCREF(result);
+    
+done:
+    PyBuffer_Release(&out_buf);
+    PyBuffer_Release(&buf1);
+    PyBuffer_Release(&buf2);
+    return result;
+}
 
-    const char* data1 = PyBytes_AsString(bytes1);
-    if (!data1) {
+/*
+ * Fused XOR of any number of equal-length bytes-like objects
+ * Replaces acc = xor(acc, b) chains, which re-read and re-write acc per buffer
+ */
+static PyObject* xor_reduce(PyObject* self, PyObject* args) {
+    PyObject* buffers;
+    PyObject* result_bytes = NULL;
+    
+    if (!PyArg_ParseTuple(args, "O", &buffers)) {
         return NULL;
     }
-    const char* data2 = PyBytes_AsString(bytes2);
-    if (!data2) {
+    
+    PyObject* items = PySequence_Fast(buffers, "xor_reduce() argument must be a sequence of bytes-like objects");
+    if (!items) {
         return NULL;
     }
     
-    if (size1 != size2) {
-        PyErr_SetString(PyExc_ValueError, "Byte objects must have the same length");
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(items);
+    if (count == 0) {
+        Py_DECREF(items);
+        PyErr_SetString(PyExc_ValueError, "At least one input buffer is required");
         return NULL;
     }
     
-    if (size1 == 0) {
-        return PyBytes_FromStringAndSize("", 0);
+    /* The views hold their exporters alive (and unresizable) while the GIL is released */
+    Py_buffer* views = (Py_buffer*)PyMem_Malloc((size_t)count * sizeof(Py_buffer));
+    const char** srcs = (const char**)PyMem_Malloc((size_t)count * sizeof(const char*));
+    Py_ssize_t acquired = 0;
+    if (!views || !srcs) {
+        PyErr_SetString(PyExc_MemoryError, "Failed to allocate memory for buffer list");
+        goto done;
+    }
+    
+    for (; acquired < count; acquired++) {
+        PyObject* item = PySequence_Fast_GET_ITEM(items, acquired);
+        if (PyObject_GetBuffer(item, &views[acquired], PyBUF_SIMPLE) < 0) {
+            goto done;
+        }
+        srcs[acquired] = views[acquired].buf;
+        if (views[acquired].len != views[0].len) {
+            PyErr_SetString(PyExc_ValueError, "Input buffers must have the same length");
+            acquired++;
+            goto done;
+        }
     }
     
-    if (size1 < 0) {
-        PyErr_SetString(PyExc_OverflowError, "Negative size encountered");
+    Py_ssize_t size = views[0].len;
+    result_bytes = PyBytes_FromStringAndSize(NULL, size);
+    if (!result_bytes) {
+        goto done;
+    }
+    
+    char* out = PyBytes_AS_STRING(result_bytes);
+    if ((size_t)size * (size_t)count >= FASTXOR_NOGIL_THRESHOLD) {
+        Py_BEGIN_ALLOW_THREADS
+        xor_reduce_kernel(out, srcs, count, (size_t)size);
+        Py_END_ALLOW_THREADS
+    } else {
+        xor_reduce_kernel(out, srcs, count, (size_t)size);
+    }
+    
+done:
+    for (Py_ssize_t j = 0; j < acquired; j++) {
+        PyBuffer_Release(&views[j]);
+    }
+    PyMem_Free(views);
+    PyMem_Free(srcs);
+    Py_DECREF(items);
+    return result_bytes;
+}
+
+/*
+ * XOR data against a repeating key without materializing the tiled key
+ * Keys whose length divides 64 take the register-resident pattern kernels
+ */
+static PyObject* xor_key(PyObject* self, PyObject* args) {
+    Py_buffer data_buf, key_buf;
+    PyObject* result_bytes = NULL;
+    char* tiled = NULL;
+    
+    if (!PyArg_ParseTuple(args, "y*y*", &data_buf, &key_buf)) {
         return NULL;
     }
-    size_t alloc_size = (size_t)size1;
-    char* result = (char*)PyMem_Malloc(alloc_size);
-    if (!result) {
-        PyErr_SetString(PyExc_MemoryError, "Failed to allocate memory for result");
+    
+    if (key_buf.len == 0) {
+        PyErr_SetString(PyExc_ValueError, "Key must not be empty");
+        goto done;
+    }
+    
+    result_bytes = PyBytes_FromStringAndSize(NULL, data_buf.len);
+    if (!result_bytes) {
+        goto done;
+    }
+    
+    char* out = PyBytes_AS_STRING(result_bytes);
+    const char* data = data_buf.buf;
+    size_t n = (size_t)data_buf.len;
+    size_t key_len = (size_t)key_buf.len;
+    PyThreadState* thread_state = NULL;
+    
+    if (64 % key_len == 0) {
+        char pattern[64];
+        xor_tile_key(pattern, sizeof(pattern), key_buf.buf, key_len);
+        
+        if (n >= FASTXOR_NOGIL_THRESHOLD) {
+            thread_state = PyEval_SaveThread();
+        }
+        xor_key_kernel(out, data, pattern, n);
+    } else {
+        const char* block = key_buf.buf;
+        size_t block_len = key_len;
+        if (key_len < FASTXOR_KEY_BLOCK) {
+            block_len = key_len * (FASTXOR_KEY_BLOCK / key_len);
+            tiled = (char*)PyMem_Malloc(block_len);
+            if (!tiled) {
+                Py_CLEAR(result_bytes);
+                PyErr_SetString(PyExc_MemoryError, "Failed to allocate memory for key block");
+                goto done;
+            }
+            xor_tile_key(tiled, block_len, key_buf.buf, key_len);
+            block = tiled;
+        }
+        
+        if (n >= FASTXOR_NOGIL_THRESHOLD) {
+            thread_state = PyEval_SaveThread();
+        }
+        xor_key_blocks(out, data, n, block, block_len);
+    }
+    
+    if (thread_state) {
+        PyEval_RestoreThread(thread_state);
+    }
+    
+done:
+    PyMem_Free(tiled);
+    PyBuffer_Release(&data_buf);
+    PyBuffer_Release(&key_buf);
+    return result_bytes;
+}
+
+/*
+ * XOR two packed row-major matrices of nrows x rowlen bytes
+ * Rows are contiguous, so the whole matrix is one stream through the kernel
+ */
+static PyObject* xor_matrix(PyObject* self, PyObject* args) {
+    Py_buffer buf1, buf2;
+    Py_ssize_t nrows, rowlen;
+    PyObject* result_bytes = NULL;
+    
+    if (!PyArg_ParseTuple(args, "y*y*nn", &buf1, &buf2, &nrows, &rowlen)) {
         return NULL;
     }
     
-    /* Pure byte-wise XOR to avoid alignment UB; still vectorisable by compiler */
-    for (Py_ssize_t j = 0; j < size1; j++) {
-        result[j] = data1[j] ^ data2[j];
+    if (nrows < 0 || rowlen < 0) {
+        PyErr_SetString(PyExc_ValueError, "nrows and rowlen must not be negative");
+        goto done;
     }
-    Py_ssize_t i = size1; /* for clarity; not used afterward */
     
-    PyObject* result_bytes = PyBytes_FromStringAndSize(result, size1);
-    PyMem_Free(result);
+    if (rowlen != 0 && nrows > PY_SSIZE_T_MAX / rowlen) {
+        PyErr_SetString(PyExc_OverflowError, "nrows * rowlen is too large");
+        goto done;
+    }
+    
+    if (buf1.len != nrows * rowlen || buf2.len != nrows * rowlen) {
+        PyErr_SetString(PyExc_ValueError, "Input buffers must be exactly nrows * rowlen bytes");
+        goto done;
+    }
     
+    result_bytes = PyBytes_FromStringAndSize(NULL, buf1.len);
     if (!result_bytes) {
-        PyErr_SetString(PyExc_RuntimeError, "Failed to create result bytes object");
-        return NULL;
+        goto done;
     }
     
+    run_xor_kernel(PyBytes_AS_STRING(result_bytes), buf1.buf, buf2.buf, (size_t)buf1.len);
+    
+done:
+    PyBuffer_Release(&buf1);
+    PyBuffer_Release(&buf2);
     return result_bytes;
 }
 
+/*
+ * XOR two buffers into a list of chunk_size-byte results, last one possibly short
+ * All result objects are allocated up front so the XOR loop can run without the GIL
+ */
+static PyObject* xor_chunks(PyObject* self, PyObject* args) {
+    Py_buffer buf1, buf2;
+    Py_ssize_t chunk_size;
+    PyObject* result_list = NULL;
+    
+    if (!PyArg_ParseTuple(args, "y*y*n", &buf1, &buf2, &chunk_size)) {
+        return NULL;
+    }
+    
+    if (buf1.len != buf2.len) {
+        PyErr_SetString(PyExc_ValueError, "Input buffers must have the same length");
+        goto done;
+    }
+    
+    if (chunk_size < 1) {
+        PyErr_SetString(PyExc_ValueError, "Chunk size must be positive");
+        goto done;
+    }
+    
+    Py_ssize_t n = buf1.len;
+    Py_ssize_t nchunks = n / chunk_size + (n % chunk_size != 0);
+    result_list = PyList_New(nchunks);
+    if (!result_list) {
+        goto done;
+    }
+    
+    for (Py_ssize_t i = 0; i < nchunks; i++) {
+        Py_ssize_t off = i * chunk_size;
+        PyObject* chunk = PyBytes_FromStringAndSize(NULL, n - off < chunk_size ? n - off : chunk_size);
+        if (!chunk) {
+            Py_CLEAR(result_list);
+            goto done;
+        }
+        PyList_SET_ITEM(result_list, i, chunk);
+    }
+    
+    /* The list is not visible to any other code yet, so reading it without the GIL is safe */
+    const char* a = buf1.buf;
+    const char* b = buf2.buf;
+    PyThreadState* thread_state = NULL;
+    if (n >= FASTXOR_NOGIL_THRESHOLD) {
+        thread_state = PyEval_SaveThread();
+    }
+    for (Py_ssize_t i = 0; i < nchunks; i++) {
+        PyObject* chunk = PyList_GET_ITEM(result_list, i);
+        Py_ssize_t off = i * chunk_size;
+        xor_kernel(PyBytes_AS_STRING(chunk), a + off, b + off, (size_t)PyBytes_GET_SIZE(chunk));
+    }
+    if (thread_state) {
+        PyEval_RestoreThread(thread_state);
+    }
+    
+done:
+    PyBuffer_Release(&buf1);
+    PyBuffer_Release(&buf2);
+    return result_list;
+}
+
 /*
  * Get performance info about the current implementation
  */
@@ -146,6 +945,8 @@ static PyObject* get_info(PyObject* self, PyObject* args) {
     
     PyDict_SetItemString(info_dict, "word_size", PyLong_FromLong(sizeof(uint64_t) * 8));
     PyDict_SetItemString(info_dict, "alignment", PyLong_FromLong(sizeof(uint64_t)));
+    PyDict_SetItemString(info_dict, "simd", PyUnicode_FromString(xor_kernel_name));
+    PyDict_SetItemString(info_dict, "nt_threshold", PyLong_FromSize_t(xor_nt_threshold));
     PyDict_SetItemString(info_dict, "version", PyUnicode_FromString("1.0"));
     PyDict_SetItemString(info_dict, "description", PyUnicode_FromString("Fast 64-bit XOR operations"));
     
@@ -156,53 +957,45 @@ static PyObject* get_info(PyObject* self, PyObject* args) {
 static PyMethodDef FastXorMethods[] = {
     {
         "xor64", 
-        fast_xor64, 
-        METH_VARARGS,
+        (PyCFunction)(void(*)(void))flexible_xor, 
+        METH_FASTCALL,
         "xor64(data1, data2) -> bytes\n\n"
-        "Perform fast 64-bit XOR operation on two bytes objects.\n\n"
-        "This function provides maximum performance by processing 8 bytes at a time\n"
-        "using native 64-bit integer operations. Both input objects must have\n"
-        "identical lengths that are multiples of 8 bytes.\n\n"
+        "Alias of xor(), kept for backward compatibility.\n\n"
+        "Earlier versions required lengths that were a non-zero multiple of\n"
+        "8 bytes; any length is now accepted and the result is identical to\n"
+        "xor(data1, data2).\n\n"
         "Parameters:\n"
-        "    data1 (bytes): First bytes object to XOR\n"
-        "    data2 (bytes): Second bytes object to XOR\n\n"
+        "    data1 (bytes-like): First buffer to XOR\n"
+        "    data2 (bytes-like): Second buffer to XOR\n\n"
         "Returns:\n"
         "    bytes: XOR result of data1 ^ data2\n\n"
         "Raises:\n"
-        "    ValueError: If inputs have different lengths, are less than 8 bytes,\n"
-        "                or length is not a multiple of 8 bytes\n"
+        "    ValueError: If inputs have different lengths\n"
         "    MemoryError: If memory allocation fails\n"
-        "    RuntimeError: If result bytes object creation fails\n\n"
+        "    TypeError: If an input does not support the buffer protocol\n\n"
         "Example:\n"
         "    >>> import fastxor\n"
-        "    >>> data1 = b'12345678' * 16  # 128 bytes\n"
-        "    >>> data2 = b'abcdefgh' * 16  # 128 bytes\n"
-        "    >>> result = fastxor.xor64(data1, data2)\n"
-        "    >>> len(result)\n"
-        "    128\n\n"
-        "Note:\n"
-        "    For maximum performance, ensure your data size is a multiple of 8 bytes.\n"
-        "    This function is optimized for bulk data processing and cryptographic\n"
-        "    operations where alignment guarantees can be made."
+        "    >>> fastxor.xor64(b'1234567', b'abcdefg') == fastxor.xor(b'1234567', b'abcdefg')\n"
+        "    True"
     },
     {
         "xor", 
-        flexible_xor, 
-        METH_VARARGS,
+        (PyCFunction)(void(*)(void))flexible_xor, 
+        METH_FASTCALL,
         "xor(data1, data2) -> bytes\n\n"
         "Flexible XOR operation using 64-bit optimization where possible.\n\n"
         "This function automatically uses 64-bit operations for aligned portions\n"
         "of the data and falls back to byte-wise operations for any remainder.\n"
         "It handles any size data without alignment restrictions.\n\n"
         "Parameters:\n"
-        "    data1 (bytes): First bytes object to XOR\n"
-        "    data2 (bytes): Second bytes object to XOR\n\n"
+        "    data1 (bytes-like): First buffer to XOR\n"
+        "    data2 (bytes-like): Second buffer to XOR\n\n"
         "Returns:\n"
         "    bytes: XOR result of data1 ^ data2\n\n"
         "Raises:\n"
         "    ValueError: If inputs have different lengths\n"
         "    MemoryError: If memory allocation fails\n"
-        "    RuntimeError: If result bytes object creation fails\n\n"
+        "    TypeError: If an input does not support the buffer protocol\n\n"
         "Example:\n"
         "    >>> import fastxor\n"
         "    >>> data1 = b'Hello, World!'  # 13 bytes\n"
@@ -211,9 +1004,160 @@ static PyMethodDef FastXorMethods[] = {
         "    >>> len(result)\n"
         "    13\n\n"
         "Performance:\n"
-        "    - Uses 64-bit operations for first len(data) // 8 * 8 bytes\n"
-        "    - Uses byte operations for remaining len(data) % 8 bytes\n"
-        "    - Automatically chooses optimal strategy based on data size"
+        "    - Uses the widest kernel the CPU supports, picked at import\n"
+        "      (get_info()['simd']: AVX-512BW/F, AVX, SSE, NEON or scalar)\n"
+        "    - Vector body unrolled 4x, then a 64/32-bit word and byte tail,\n"
+        "      or a single masked store on AVX-512BW\n"
+        "    - Accepts any length and alignment"
+    },
+    {
+        "xor_many", 
+        xor_many, 
+        METH_VARARGS,
+        "xor_many(data1, data2, chunk_size) -> bytes\n\n"
+        "XOR two buffers made of fixed-size chunks in a single call.\n\n"
+        "The result is identical to joining xor() over every chunk_size slice,\n"
+        "but the whole buffer is processed by one C loop, avoiding a Python call\n"
+        "and a bytes allocation per chunk.\n\n"
+        "Parameters:\n"
+        "    data1 (bytes-like): First buffer to XOR\n"
+        "    data2 (bytes-like): Second buffer to XOR\n"
+        "    chunk_size (int): Chunk size in bytes (positive)\n\n"
+        "Returns:\n"
+        "    bytes: XOR result of data1 ^ data2\n\n"
+        "Raises:\n"
+        "    ValueError: If inputs have different lengths, chunk_size is not\n"
+        "                positive, or the length is not a multiple of chunk_size\n"
+        "    MemoryError: If memory allocation fails\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> data1 = b'12345678' * 1024  # 8KB\n"
+        "    >>> data2 = b'abcdefgh' * 1024  # 8KB\n"
+        "    >>> result = fastxor.xor_many(data1, data2, 128)\n"
+        "    >>> result[:128] == fastxor.xor(data1[:128], data2[:128])\n"
+        "    True"
+    },
+    {
+        "xor_into", 
+        xor_into, 
+        METH_VARARGS,
+        "xor_into(out, data1, data2) -> None\n\n"
+        "XOR two bytes-like objects into a caller-supplied writable buffer.\n\n"
+        "Writes data1 ^ data2 into out without allocating a result object, so a\n"
+        "single bytearray can be reused across many chunks.\n\n"
+        "Parameters:\n"
+        "    out (bytearray): Writable buffer receiving the result\n"
+        "    data1 (bytes-like): First buffer to XOR\n"
+        "    data2 (bytes-like): Second buffer to XOR\n\n"
+        "Raises:\n"
+        "    TypeError: If out is not a writable buffer\n"
+        "    ValueError: If inputs and out have different lengths\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> out = bytearray(16)\n"
+        "    >>> fastxor.xor_into(out, b'Hello World!!!!!', b'Secret Key 12345')\n"
+        "    >>> bytes(out) == fastxor.xor(b'Hello World!!!!!', b'Secret Key 12345')\n"
+        "    True"
+    },
+    {
+        "xor_reduce", 
+        xor_reduce, 
+        METH_VARARGS,
+        "xor_reduce(buffers) -> bytes\n\n"
+        "XOR any number of equal-length bytes-like objects together in one pass.\n\n"
+        "Equivalent to folding xor() over the sequence, but each block of the\n"
+        "result is combined with every input while it is still in cache, so\n"
+        "the output is written to memory once instead of once per input.\n\n"
+        "Parameters:\n"
+        "    buffers (sequence of bytes-like): Buffers to combine, all the same length\n\n"
+        "Returns:\n"
+        "    bytes: buffers[0] ^ buffers[1] ^ ... ^ buffers[-1]\n\n"
+        "Raises:\n"
+        "    TypeError: If buffers is not a sequence of bytes-like objects\n"
+        "    ValueError: If buffers is empty or the lengths differ\n"
+        "    MemoryError: If memory allocation fails\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> parity = fastxor.xor_reduce([b'\\x01\\x02', b'\\x04\\x08', b'\\x10\\x20'])\n"
+        "    >>> parity\n"
+        "    b'\\x15*'"
+    },
+    {
+        "xor_key", 
+        xor_key, 
+        METH_VARARGS,
+        "xor_key(data, key) -> bytes\n\n"
+        "XOR data against a key repeated to the length of data.\n\n"
+        "Equivalent to xor(data, (key * n)[:len(data)]) without building the\n"
+        "tiled key. Keys whose length divides 64 (e.g. 4-byte websocket masks,\n"
+        "16/32/64-byte keys) are held in SIMD registers for the whole loop;\n"
+        "other lengths are tiled into a small cache-resident block.\n\n"
+        "Parameters:\n"
+        "    data (bytes-like): Data to XOR, any size\n"
+        "    key (bytes-like): Non-empty key, repeated as needed\n\n"
+        "Returns:\n"
+        "    bytes: data[i] ^ key[i % len(key)] for every i\n\n"
+        "Raises:\n"
+        "    ValueError: If key is empty\n"
+        "    MemoryError: If memory allocation fails\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> masked = fastxor.xor_key(b'Hello, World!', b'\\x37\\xfa\\x21\\x3d')\n"
+        "    >>> fastxor.xor_key(masked, b'\\x37\\xfa\\x21\\x3d')\n"
+        "    b'Hello, World!'"
+    },
+    {
+        "xor_matrix", 
+        xor_matrix, 
+        METH_VARARGS,
+        "xor_matrix(A, B, nrows, rowlen) -> bytes\n\n"
+        "XOR two packed row-major matrices of nrows rows by rowlen bytes.\n\n"
+        "Many equal-size chunks packed side by side (e.g. erasure-code or MPC\n"
+        "shares) are processed as one contiguous stream, with a single call and\n"
+        "a single result allocation instead of one per chunk.\n\n"
+        "Parameters:\n"
+        "    A (bytes-like): First matrix, nrows * rowlen bytes\n"
+        "    B (bytes-like): Second matrix, nrows * rowlen bytes\n"
+        "    nrows (int): Number of rows\n"
+        "    rowlen (int): Bytes per row\n\n"
+        "Returns:\n"
+        "    bytes: A ^ B in the same row-major layout\n\n"
+        "Raises:\n"
+        "    ValueError: If nrows or rowlen is negative, or either buffer is not\n"
+        "                exactly nrows * rowlen bytes\n"
+        "    OverflowError: If nrows * rowlen does not fit in a Py_ssize_t\n"
+        "    MemoryError: If memory allocation fails\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> rows_a = [b'abcd', b'efgh', b'ijkl']\n"
+        "    >>> rows_b = [b'1234', b'5678', b'90ab']\n"
+        "    >>> out = fastxor.xor_matrix(b''.join(rows_a), b''.join(rows_b), 3, 4)\n"
+        "    >>> out[4:8] == fastxor.xor(rows_a[1], rows_b[1])\n"
+        "    True"
+    },
+    {
+        "xor_chunks", 
+        xor_chunks, 
+        METH_VARARGS,
+        "xor_chunks(data1, data2, chunk_size) -> list[bytes]\n\n"
+        "XOR two buffers and return the result split into chunk_size pieces.\n\n"
+        "Equivalent to [xor(data1[i:i+chunk_size], data2[i:i+chunk_size]) for i\n"
+        "in range(0, len(data1), chunk_size)], but the loop, the slicing and the\n"
+        "result allocations all happen in C. The last chunk is shorter when the\n"
+        "length is not a multiple of chunk_size.\n\n"
+        "Parameters:\n"
+        "    data1 (bytes-like): First buffer to XOR\n"
+        "    data2 (bytes-like): Second buffer to XOR\n"
+        "    chunk_size (int): Chunk size in bytes (positive)\n\n"
+        "Returns:\n"
+        "    list[bytes]: XOR result of data1 ^ data2, one bytes object per chunk\n\n"
+        "Raises:\n"
+        "    ValueError: If inputs have different lengths or chunk_size is not positive\n"
+        "    MemoryError: If memory allocation fails\n\n"
+        "Example:\n"
+        "    >>> import fastxor\n"
+        "    >>> fastxor.xor_chunks(b'\\x01\\x02\\x03\\x04\\x05', b'\\x00' * 5, 2)\n"
+        "    [b'\\x01\\x02', b'\\x03\\x04', b'\\x05']"
     },
     {
         "get_info", 
@@ -226,7 +1170,11 @@ static PyMethodDef FastXorMethods[] = {
         "Returns:\n"
         "    dict: Implementation information with the following keys:\n"
         "        - 'word_size' (int): Bit size of native integer operations (64)\n"
-        "        - 'alignment' (int): Required byte alignment for xor64() (8)\n"
+        "        - 'alignment' (int): Word size in bytes of the scalar path (8);\n"
+        "          no function requires aligned or 8-byte-multiple inputs\n"
+        "        - 'simd' (str): XOR kernel in use ('avx512bw', 'avx512f', 'avx', 'sse', 'neon' or 'scalar')\n"
+        "        - 'nt_threshold' (int): Size in bytes from which x86 kernels use\n"
+        "          non-temporal stores (FASTXOR_NT_THRESHOLD, default 8MB)\n"
         "        - 'version' (str): Module version string\n"
         "        - 'description' (str): Brief description of capabilities\n\n"
         "Example:\n"
@@ -256,32 +1204,43 @@ static struct PyModuleDef fastxormodule = {
     "  • Native 64-bit XOR operations for maximum performance\n"
     "  • Automatic fallback for non-aligned data\n"
     "  • Comprehensive error handling and validation\n"
-    "  • Memory-efficient processing\n"
+    "  • Memory-efficient processing; accepts bytes, bytearray, memoryview\n"
+    "    and any other C-contiguous buffer without copying\n"
     "  • Thread-safe operations\n\n"
     "Functions:\n"
-    "  xor64(data1, data2)  - Fast XOR requiring 8-byte alignment\n"
+    "  xor64(data1, data2)  - Alias of xor(), kept for compatibility\n"
     "  xor(data1, data2)    - Flexible XOR handling any size data\n"
+    "  xor_many(data1, data2, chunk_size) - Batched XOR over chunked buffers\n"
+    "  xor_into(out, data1, data2) - XOR into a reusable writable buffer\n"
+    "  xor_reduce(buffers)  - Fused XOR of many equal-length buffers\n"
+    "  xor_key(data, key)   - XOR against a repeating key\n"
+    "  xor_matrix(A, B, nrows, rowlen) - XOR of packed row-major matrices\n"
+    "  xor_chunks(data1, data2, chunk_size) - XOR split into a list of chunks\n"
     "  get_info()           - Implementation details and capabilities\n\n"
     "Constants:\n"
     "  WORD_SIZE           - Native word size in bits (64)\n"
-    "  MIN_SIZE            - Minimum size for xor64() function (8 bytes)\n\n"
+    "  MIN_SIZE            - Former xor64() minimum size, no longer enforced (8)\n\n"
     "Performance:\n"
     "  Typical speedups of 5-20x over pure Python implementations,\n"
-    "  depending on data size and alignment. Best performance achieved\n"
-    "  with data sizes that are multiples of 8 bytes.\n\n"
+    "  depending on data size.\n\n"
     "Example Usage:\n"
     "  >>> import fastxor\n"
     "  >>> data1 = b'Hello World!!!!!'  # 16 bytes\n"
     "  >>> data2 = b'Secret Key 12345'  # 16 bytes\n"
-    "  >>> result = fastxor.xor64(data1, data2)\n"
-    "  >>> # Use xor() for any size data\n"
-    "  >>> result = fastxor.xor(b'Any size', b'data here')\n\n"
+    "  >>> result = fastxor.xor(data1, data2)\n"
+    "  >>> # Any length works, no alignment needed\n"
+    "  >>> result = fastxor.xor(b'Any size!', b'data here')\n\n"
     "Thread Safety:\n"
     "  All functions are thread-safe and can be called concurrently\n"
-    "  from multiple threads without synchronization.\n\n"
+    "  from multiple threads without synchronization. The GIL is released\n"
+    "  while XORing buffers of 4KB or more, so such calls run in parallel.\n\n"
     "Memory Usage:\n"
-    "  Functions allocate temporary memory equal to input size.\n"
-    "  Memory is automatically freed on function return.\n\n"
+    "  Functions allocate only the result object, and inputs are read in\n"
+    "  place through the buffer protocol, so memoryview slices cost no copy.\n"
+    "  xor_into() writes into the caller's buffer and allocates nothing.\n"
+    "  On x86, outputs of 8MB or more (FASTXOR_NT_THRESHOLD environment\n"
+    "  variable, read at import) are written with non-temporal stores\n"
+    "  that bypass the cache.\n\n"
     "For more information, see individual function documentation.",
     -1,  // Module state size (-1 = global state)
     FastXorMethods  // Method definitions
@@ -292,6 +1251,8 @@ PyMODINIT_FUNC PyInit_fastxor(void) {
     PyObject* module = PyModule_Create(&fastxormodule);
     if (!module) return NULL;
     
+    select_xor_kernel();
+    
     // Add module-level constants
     PyModule_AddIntConstant(module, "WORD_SIZE", sizeof(uint64_t) * 8);
     PyModule_AddIntConstant(module, "MIN_SIZE", 8);
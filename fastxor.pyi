@@ -7,7 +7,12 @@ enabling better IDE support, static type checking, and documentation.
 Save this file as: fastxor.pyi
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence, Union
+
+
+# Any C-contiguous object supporting the buffer protocol is accepted
+# (bytes, bytearray, memoryview, array.array, numpy arrays, ...).
+BytesLike = Union[bytes, bytearray, memoryview]
 
 
 # Module constants
@@ -15,51 +20,38 @@ WORD_SIZE: int = 64
 """Native word size in bits (always 64 for this implementation)."""
 
 MIN_SIZE: int = 8
-"""Minimum data size in bytes required for xor64() function."""
+"""Former minimum data size in bytes for xor64(); no longer enforced."""
 
 
-def xor64(data1: bytes, data2: bytes) -> bytes:
+def xor64(data1: BytesLike, data2: BytesLike) -> bytes:
     """
-    Perform fast 64-bit XOR operation on two bytes objects.
+    Alias of xor(), kept for backward compatibility.
 
-    This function provides maximum performance by processing 8 bytes at a time
-    using native 64-bit integer operations. Both input objects must have
-    identical lengths that are multiples of 8 bytes.
+    Earlier versions required lengths that were a non-zero multiple of
+    8 bytes; any length is now accepted and the result is identical to
+    xor(data1, data2).
 
     Args:
-        data1: First bytes object to XOR. Must be multiple of 8 bytes.
-        data2: Second bytes object to XOR. Must be same length as data1.
+        data1: First buffer to XOR. Can be any size.
+        data2: Second buffer to XOR. Must be same length as data1.
 
     Returns:
         XOR result of data1 ^ data2 as bytes object.
 
     Raises:
-        ValueError: If inputs have different lengths, are less than 8 bytes,
-                   or length is not a multiple of 8 bytes.
+        ValueError: If inputs have different lengths.
         MemoryError: If memory allocation fails.
-        RuntimeError: If result bytes object creation fails.
+        TypeError: If an input does not support the buffer protocol.
 
     Example:
         >>> import fastxor
-        >>> data1 = b'12345678' * 16  # 128 bytes
-        >>> data2 = b'abcdefgh' * 16  # 128 bytes
-        >>> result = fastxor.xor64(data1, data2)
-        >>> len(result)
-        128
-
-    Note:
-        For maximum performance, ensure your data size is a multiple of 8 bytes.
-        This function is optimized for bulk data processing and cryptographic
-        operations where alignment guarantees can be made.
-
-    Performance:
-        Processes 8 bytes per operation using native 64-bit CPU instructions.
-        Typical speedup: 10-20x over byte-wise Python operations.
+        >>> fastxor.xor64(b'1234567', b'abcdefg') == fastxor.xor(b'1234567', b'abcdefg')
+        True
     """
     ...
 
 
-def xor(data1: bytes, data2: bytes) -> bytes:
+def xor(data1: BytesLike, data2: BytesLike) -> bytes:
     """
     Flexible XOR operation using 64-bit optimization where possible.
 
@@ -68,8 +60,8 @@ def xor(data1: bytes, data2: bytes) -> bytes:
     It handles any size data without alignment restrictions.
 
     Args:
-        data1: First bytes object to XOR. Can be any size.
-        data2: Second bytes object to XOR. Must be same length as data1.
+        data1: First buffer to XOR. Can be any size.
+        data2: Second buffer to XOR. Must be same length as data1.
 
     Returns:
         XOR result of data1 ^ data2 as bytes object.
@@ -77,7 +69,7 @@ def xor(data1: bytes, data2: bytes) -> bytes:
     Raises:
         ValueError: If inputs have different lengths.
         MemoryError: If memory allocation fails.
-        RuntimeError: If result bytes object creation fails.
+        TypeError: If an input does not support the buffer protocol.
 
     Example:
         >>> import fastxor
@@ -88,9 +80,11 @@ def xor(data1: bytes, data2: bytes) -> bytes:
         13
 
     Performance:
-        - Uses 64-bit operations for first (len(data) // 8) * 8 bytes
-        - Uses byte operations for remaining len(data) % 8 bytes
-        - Automatically chooses optimal strategy based on data size
+        - Uses the widest kernel the CPU supports, picked at import
+          (get_info()['simd']: AVX-512BW/F, AVX, SSE, NEON or scalar)
+        - Vector body unrolled 4x, then a 64/32-bit word and byte tail,
+          or a single masked store on AVX-512BW
+        - Accepts any length and alignment
         - Typical speedup: 5-15x over byte-wise Python operations
 
     Note:
@@ -100,6 +94,209 @@ def xor(data1: bytes, data2: bytes) -> bytes:
     ...
 
 
+def xor_many(data1: BytesLike, data2: BytesLike, chunk_size: int) -> bytes:
+    """
+    XOR two buffers made of fixed-size chunks in a single call.
+
+    The result is identical to joining xor() over every chunk_size slice,
+    but the whole buffer is processed by one C loop, avoiding a Python call
+    and a bytes allocation per chunk.
+
+    Args:
+        data1: First buffer to XOR. Must be a multiple of chunk_size.
+        data2: Second buffer to XOR. Must be same length as data1.
+        chunk_size: Chunk size in bytes. Must be positive.
+
+    Returns:
+        XOR result of data1 ^ data2 as bytes object.
+
+    Raises:
+        ValueError: If inputs have different lengths, chunk_size is not
+                   positive, or the length is not a multiple of chunk_size.
+        MemoryError: If memory allocation fails.
+
+    Example:
+        >>> import fastxor
+        >>> data1 = b'12345678' * 1024  # 8KB
+        >>> data2 = b'abcdefgh' * 1024  # 8KB
+        >>> result = fastxor.xor_many(data1, data2, 128)
+        >>> result[:128] == fastxor.xor(data1[:128], data2[:128])
+        True
+
+    Performance:
+        One Python-to-C transition for the whole buffer instead of one per
+        chunk; for 128-byte chunks this removes 8192 calls per MB.
+    """
+    ...
+
+
+def xor_into(out: Union[bytearray, memoryview], data1: BytesLike, data2: BytesLike) -> None:
+    """
+    XOR two bytes-like objects into a caller-supplied writable buffer.
+
+    Writes data1 ^ data2 into out without allocating a result object, so a
+    single bytearray can be reused across many chunks.
+
+    Args:
+        out: Writable buffer receiving the result. Must be same length as data1.
+        data1: First buffer to XOR. Can be any size.
+        data2: Second buffer to XOR. Must be same length as data1.
+
+    Raises:
+        TypeError: If out is not a writable buffer.
+        ValueError: If inputs and out have different lengths.
+
+    Example:
+        >>> import fastxor
+        >>> out = bytearray(16)
+        >>> fastxor.xor_into(out, b'Hello World!!!!!', b'Secret Key 12345')
+        >>> bytes(out) == fastxor.xor(b'Hello World!!!!!', b'Secret Key 12345')
+        True
+
+    Performance:
+        Skips the per-call result allocation, which dominates for small
+        chunks such as 128-byte blocks processed in a loop.
+    """
+    ...
+
+
+def xor_reduce(buffers: Sequence[BytesLike]) -> bytes:
+    """
+    XOR any number of equal-length bytes-like objects together in one pass.
+
+    Equivalent to folding xor() over the sequence, but each block of the
+    result is combined with every input while it is still in cache, so
+    the output is written to memory once instead of once per input.
+
+    Args:
+        buffers: Buffers to combine. Must be non-empty and all the same length.
+
+    Returns:
+        buffers[0] ^ buffers[1] ^ ... ^ buffers[-1] as bytes object.
+
+    Raises:
+        TypeError: If buffers is not a sequence of bytes-like objects.
+        ValueError: If buffers is empty or the lengths differ.
+        MemoryError: If memory allocation fails.
+
+    Example:
+        >>> import fastxor
+        >>> parity = fastxor.xor_reduce([b'\x01\x02', b'\x04\x08', b'\x10\x20'])
+        >>> parity
+        b'\x15*'
+
+    Performance:
+        Folding N buffers with chained xor() calls reads and writes the
+        accumulator N - 1 times; xor_reduce() writes the result once.
+        Well suited to parity / erasure-code style workloads.
+    """
+    ...
+
+
+def xor_key(data: BytesLike, key: BytesLike) -> bytes:
+    """
+    XOR data against a key repeated to the length of data.
+
+    Equivalent to xor(data, (key * n)[:len(data)]) without building the
+    tiled key. Keys whose length divides 64 (e.g. 4-byte websocket masks,
+    16/32/64-byte keys) are held in SIMD registers for the whole loop;
+    other lengths are tiled into a small cache-resident block.
+
+    Args:
+        data: Data to XOR. Can be any size.
+        key: Non-empty key, repeated as needed.
+
+    Returns:
+        data[i] ^ key[i % len(key)] for every i, as bytes object.
+
+    Raises:
+        ValueError: If key is empty.
+        MemoryError: If memory allocation fails.
+
+    Example:
+        >>> import fastxor
+        >>> masked = fastxor.xor_key(b'Hello, World!', b'\x37\xfa\x21\x3d')
+        >>> fastxor.xor_key(masked, b'\x37\xfa\x21\x3d')
+        b'Hello, World!'
+
+    Performance:
+        Reads only the data stream; no key-sized allocation for short keys.
+    """
+    ...
+
+
+def xor_matrix(A: BytesLike, B: BytesLike, nrows: int, rowlen: int) -> bytes:
+    """
+    XOR two packed row-major matrices of nrows rows by rowlen bytes.
+
+    Many equal-size chunks packed side by side (e.g. erasure-code or MPC
+    shares) are processed as one contiguous stream, with a single call and
+    a single result allocation instead of one per chunk.
+
+    Args:
+        A: First matrix, nrows * rowlen bytes.
+        B: Second matrix, nrows * rowlen bytes.
+        nrows: Number of rows.
+        rowlen: Bytes per row.
+
+    Returns:
+        A ^ B in the same row-major layout, as bytes object.
+
+    Raises:
+        ValueError: If nrows or rowlen is negative, or either buffer is not
+                   exactly nrows * rowlen bytes.
+        OverflowError: If nrows * rowlen does not fit in a Py_ssize_t.
+        MemoryError: If memory allocation fails.
+
+    Example:
+        >>> import fastxor
+        >>> rows_a = [b'abcd', b'efgh', b'ijkl']
+        >>> rows_b = [b'1234', b'5678', b'90ab']
+        >>> out = fastxor.xor_matrix(b''.join(rows_a), b''.join(rows_b), 3, 4)
+        >>> out[4:8] == fastxor.xor(rows_a[1], rows_b[1])
+        True
+
+    Performance:
+        Same kernel as xor(); pack the rows once and keep them packed to
+        avoid a Python call and a bytes allocation per row.
+    """
+    ...
+
+
+def xor_chunks(data1: BytesLike, data2: BytesLike, chunk_size: int) -> List[bytes]:
+    """
+    XOR two buffers and return the result split into chunk_size pieces.
+
+    Equivalent to [xor(data1[i:i+chunk_size], data2[i:i+chunk_size]) for i
+    in range(0, len(data1), chunk_size)], but the loop, the slicing and the
+    result allocations all happen in C. The last chunk is shorter when the
+    length is not a multiple of chunk_size.
+
+    Args:
+        data1: First buffer to XOR. Can be any size.
+        data2: Second buffer to XOR. Must be same length as data1.
+        chunk_size: Chunk size in bytes. Must be positive.
+
+    Returns:
+        XOR result of data1 ^ data2 as a list of bytes objects, one per chunk.
+
+    Raises:
+        ValueError: If inputs have different lengths or chunk_size is not
+                   positive.
+        MemoryError: If memory allocation fails.
+
+    Example:
+        >>> import fastxor
+        >>> fastxor.xor_chunks(b'\x01\x02\x03\x04\x05', b'\x00' * 5, 2)
+        [b'\x01\x02', b'\x03\x04', b'\x05']
+
+    Performance:
+        One Python-to-C transition for all chunks; the chunk objects are
+        allocated first and the XOR then runs with the GIL released.
+    """
+    ...
+
+
 def get_info() -> Dict[str, Any]:
     """
     Get detailed information about the fastxor implementation.
@@ -110,7 +307,11 @@ def get_info() -> Dict[str, Any]:
     Returns:
         Implementation information dictionary with keys:
         - 'word_size' (int): Bit size of native integer operations (64)
-        - 'alignment' (int): Required byte alignment for xor64() (8)
+        - 'alignment' (int): Word size in bytes of the scalar path (8);
+          no function requires aligned or 8-byte-multiple inputs
+        - 'simd' (str): XOR kernel in use ('avx512bw', 'avx512f', 'avx', 'sse', 'neon' or 'scalar')
+        - 'nt_threshold' (int): Size in bytes from which x86 kernels use
+          non-temporal stores (FASTXOR_NT_THRESHOLD, default 8MB)
         - 'version' (str): Module version string
         - 'description' (str): Brief description of capabilities
 
@@ -142,36 +343,47 @@ Key Features:
   • Native 64-bit XOR operations for maximum performance
   • Automatic fallback for non-aligned data
   • Comprehensive error handling and validation
-  • Memory-efficient processing
+  • Memory-efficient processing; accepts bytes, bytearray, memoryview
+    and any other C-contiguous buffer without copying
   • Thread-safe operations
 
 Functions:
-  xor64(data1, data2)  - Fast XOR requiring 8-byte alignment
+  xor64(data1, data2)  - Alias of xor(), kept for compatibility
   xor(data1, data2)    - Flexible XOR handling any size data
+  xor_many(data1, data2, chunk_size) - Batched XOR over chunked buffers
+  xor_into(out, data1, data2) - XOR into a reusable writable buffer
+  xor_reduce(buffers)  - Fused XOR of many equal-length buffers
+  xor_key(data, key)   - XOR against a repeating key
+  xor_matrix(A, B, nrows, rowlen) - XOR of packed row-major matrices
+  xor_chunks(data1, data2, chunk_size) - XOR split into a list of chunks
   get_info()           - Implementation details and capabilities
 
 Constants:
   WORD_SIZE           - Native word size in bits (64)
-  MIN_SIZE            - Minimum size for xor64() function (8 bytes)
+  MIN_SIZE            - Former xor64() minimum size, no longer enforced (8)
 
 Performance:
   Typical speedups of 5-20x over pure Python implementations,
-  depending on data size and alignment. Best performance achieved
-  with data sizes that are multiples of 8 bytes.
+  depending on data size.
 
 Example Usage:
   >>> import fastxor
   >>> data1 = b'Hello World!!!!!'  # 16 bytes
   >>> data2 = b'Secret Key 12345'  # 16 bytes
-  >>> result = fastxor.xor64(data1, data2)
-  >>> # Use xor() for any size data
-  >>> result = fastxor.xor(b'Any size', b'data here')
+  >>> result = fastxor.xor(data1, data2)
+  >>> # Any length works, no alignment needed
+  >>> result = fastxor.xor(b'Any size!', b'data here')
 
 Thread Safety:
   All functions are thread-safe and can be called concurrently
-  from multiple threads without synchronization.
+  from multiple threads without synchronization. The GIL is released
+  while XORing buffers of 4KB or more, so such calls run in parallel.
 
 Memory Usage:
-  Functions allocate temporary memory equal to input size.
-  Memory is automatically freed on function return.
+  Functions allocate only the result object, and inputs are read in
+  place through the buffer protocol, so memoryview slices cost no copy.
+  xor_into() writes into the caller's buffer and allocates nothing.
+  On x86, outputs of 8MB or more (FASTXOR_NT_THRESHOLD environment
+  variable, read at import) are written with non-temporal stores
+  that bypass the cache.
 """
\ No newline at end of file
@@ -11,6 +11,58 @@ Then run this test:
 
 import time
 import os
+import threading
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True)
+    def _xor_numba_kernel(a, b, out):
+        for i in prange(a.size):
+            out[i] = a[i] ^ b[i]
+
+def xor_int(data1, data2):
+    """Pure-Python XOR fallback: one bignum XOR over the whole buffer.
+
+    CPython runs the XOR of two ints in C, so this avoids allocating a
+    Python int per byte and is usable when the extension isn't built.
+    """
+    x = int.from_bytes(data1, 'little')
+    y = int.from_bytes(data2, 'little')
+    return (x ^ y).to_bytes(len(data1), 'little')
+
+def xor_numpy(data1, data2):
+    """NumPy XOR fallback: uint64 lanes for the body, uint8 for the tail.
+
+    NumPy's bitwise ufunc loops are SIMD-vectorized C, so this reaches
+    multi-GB/s without building the extension.
+    """
+    body = len(data1) // 8 * 8
+    head = np.frombuffer(data1, np.uint64, body // 8) ^ np.frombuffer(data2, np.uint64, body // 8)
+    tail = np.frombuffer(data1, np.uint8, offset=body) ^ np.frombuffer(data2, np.uint8, offset=body)
+    return head.tobytes() + tail.tobytes()
+
+def xor_numba(data1, data2):
+    """Numba XOR fallback: JIT-compiled, multi-threaded loop over uint64 lanes.
+
+    The first call pays the JIT compile; later calls approach memory
+    bandwidth. Tail bytes go through NumPy as in xor_numpy().
+    """
+    body = len(data1) // 8 * 8
+    a = np.frombuffer(data1, np.uint64, body // 8)
+    b = np.frombuffer(data2, np.uint64, body // 8)
+    out = np.empty_like(a)
+    _xor_numba_kernel(a, b, out)
+    tail = np.frombuffer(data1, np.uint8, offset=body) ^ np.frombuffer(data2, np.uint8, offset=body)
+    return out.tobytes() + tail.tobytes()
 
 def test_fastxor_performance():
     """Test the fastxor module performance against Python implementations"""
@@ -23,7 +75,9 @@ def test_fastxor_performance():
     except ImportError:
         print("❌ fastxor module not found!")
         print("Build it first with: python setup.py build_ext --inplace")
-        return
+        print("Running the fallback comparisons only (xor_numba(), xor_numpy() or xor_int())")
+        print()
+        fastxor = None
     
     # Test configuration
     mb_size = 1024 * 1024  # 1MB
@@ -31,50 +85,109 @@ def test_fastxor_performance():
     
     print(f"=== FastXOR Performance Test ===")
     print(f"Data size: {mb_size:,} bytes")
-    print(f"Chunk size: {chunk_size} bytes")
-    print(f"Chunks: {mb_size // chunk_size:,}")
+    print(f"Chunk size: {chunk_size} bytes (chunked tests only)")
     print()
     
     # Generate test data
     print("Generating test data...")
     data1 = os.urandom(mb_size)
     data2 = os.urandom(mb_size)
-    
-    chunks1 = [data1[i:i+chunk_size] for i in range(0, len(data1), chunk_size)]
-    chunks2 = [data2[i:i+chunk_size] for i in range(0, len(data2), chunk_size)]
-    print(f"Created {len(chunks1)} chunks")
     print()
     
     # Test 1: Python byte-wise XOR
     print("=== Test 1: Python Byte-wise XOR ===")
     start_time = time.time()
     
-    python_results = []
-    for c1, c2 in zip(chunks1, chunks2):
-        result = bytes(a ^ b for a, b in zip(c1, c2))
-        python_results.append(result)
+    python_result = bytes(a ^ b for a, b in zip(data1, data2))
     
     python_time = time.time() - start_time
     print(f"Time: {python_time:.4f} seconds")
     print(f"Throughput: {(mb_size / (1024*1024)) / python_time:.2f} MB/s")
     print()
     
-    # Test 2: FastXOR C extension (strict 64-bit)
+    # Test 1b: Python int XOR (fallback when the extension isn't built)
+    print("=== Test 1b: Python int XOR (xor_int fallback) ===")
+    start_time = time.time()
+    
+    int_result = xor_int(data1, data2)
+    
+    int_time = time.time() - start_time
+    print(f"Time: {int_time:.4f} seconds")
+    print(f"Throughput: {(mb_size / (1024*1024)) / int_time:.2f} MB/s")
+    
+    if int_result == python_result:
+        print("✓ Results verified - identical to Python byte-wise implementation")
+        print(f"🚀 Speedup: {python_time / int_time:.2f}x faster than Python byte-wise")
+    else:
+        print("❌ Results don't match Python implementation!")
+    print()
+    
+    # Test 1c: NumPy XOR (fallback when numpy is installed)
+    print("=== Test 1c: NumPy XOR (xor_numpy fallback) ===")
+    numpy_time = float('inf')
+    if np is None:
+        print("numpy not installed - skipping (pip install fastxor[numpy])")
+    else:
+        start_time = time.time()
+        
+        numpy_result = xor_numpy(data1, data2)
+        
+        numpy_time = time.time() - start_time
+        print(f"Time: {numpy_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / numpy_time:.2f} MB/s")
+        
+        if numpy_result == python_result:
+            print("✓ Results verified - identical to Python byte-wise implementation")
+            print(f"🚀 Speedup: {python_time / numpy_time:.2f}x faster than Python byte-wise")
+        else:
+            print("❌ Results don't match Python implementation!")
+    print()
+    
+    # Test 1d: Numba XOR (fallback when numba is installed)
+    print("=== Test 1d: Numba XOR (xor_numba fallback) ===")
+    numba_time = float('inf')
+    if njit is None:
+        print("numba not installed - skipping (pip install fastxor[numba])")
+    else:
+        xor_numba(data1[:64], data2[:64])  # Warm up: the first call compiles
+        start_time = time.time()
+        
+        numba_result = xor_numba(data1, data2)
+        
+        numba_time = time.time() - start_time
+        print(f"Time: {numba_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / numba_time:.2f} MB/s")
+        
+        if numba_result == python_result:
+            print("✓ Results verified - identical to Python byte-wise implementation")
+            print(f"🚀 Speedup: {python_time / numba_time:.2f}x faster than Python byte-wise")
+        else:
+            print("❌ Results don't match Python implementation!")
+    print()
+    
+    if fastxor is None:
+        print("=== Performance Summary ===")
+        print(f"Python byte-wise:    {(mb_size / (1024*1024)) / python_time:.2f} MB/s")
+        print(f"Python int XOR:      {(mb_size / (1024*1024)) / int_time:.2f} MB/s")
+        if numpy_time != float('inf'):
+            print(f"NumPy XOR:           {(mb_size / (1024*1024)) / numpy_time:.2f} MB/s")
+        if numba_time != float('inf'):
+            print(f"Numba XOR:           {(mb_size / (1024*1024)) / numba_time:.2f} MB/s")
+        return
+    
+    # Test 2: FastXOR C extension (xor64() alias of xor())
     print("=== Test 2: FastXOR xor64() ===")
     start_time = time.time()
     
-    fastxor_results = []
     try:
-        for c1, c2 in zip(chunks1, chunks2):
-            result = fastxor.xor64(c1, c2)
-            fastxor_results.append(result)
+        fastxor_result = fastxor.xor64(data1, data2)
         
         fastxor_time = time.time() - start_time
         print(f"Time: {fastxor_time:.4f} seconds")
         print(f"Throughput: {(mb_size / (1024*1024)) / fastxor_time:.2f} MB/s")
         
         # Verify results match
-        if python_results == fastxor_results:
+        if fastxor_result == python_result:
             print("✓ Results verified - identical to Python implementation")
             speedup = python_time / fastxor_time
             print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
@@ -84,7 +197,6 @@ def test_fastxor_performance():
     except Exception as e:
         print(f"❌ Error: {e}")
         fastxor_time = float('inf')
-        fastxor_results = []
     
     print()
     
@@ -92,17 +204,14 @@ def test_fastxor_performance():
     print("=== Test 3: FastXOR xor() (flexible) ===")
     start_time = time.time()
     
-    flexible_results = []
     try:
-        for c1, c2 in zip(chunks1, chunks2):
-            result = fastxor.xor(c1, c2)
-            flexible_results.append(result)
+        flexible_result = fastxor.xor(data1, data2)
         
         flexible_time = time.time() - start_time
         print(f"Time: {flexible_time:.4f} seconds")
         print(f"Throughput: {(mb_size / (1024*1024)) / flexible_time:.2f} MB/s")
         
-        if python_results == flexible_results:
+        if flexible_result == python_result:
             print("✓ Results verified - identical to Python implementation")
             speedup = python_time / flexible_time
             print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
@@ -115,26 +224,235 @@ def test_fastxor_performance():
     
     print()
     
+    # Test 4: FastXOR batched (chunk-validated, one call for the whole buffer)
+    print("=== Test 4: FastXOR xor_many() (batched) ===")
+    start_time = time.time()
+    
+    try:
+        batched_result = fastxor.xor_many(data1, data2, chunk_size)
+        
+        batched_time = time.time() - start_time
+        print(f"Time: {batched_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / batched_time:.2f} MB/s")
+        
+        if batched_result == python_result:
+            print("✓ Results verified - identical to Python implementation")
+            speedup = python_time / batched_time
+            print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
+        else:
+            print("❌ Results don't match Python implementation!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        batched_time = float('inf')
+    
+    print()
+    
+    # Test 5: FastXOR chunk at a time over zero-copy memoryview slices
+    print("=== Test 5: FastXOR xor64() (chunked, memoryview slices) ===")
+    mv1 = memoryview(data1)
+    mv2 = memoryview(data2)
+    start_time = time.time()
+    
+    try:
+        chunked_results = []
+        for i in range(0, mb_size, chunk_size):
+            chunked_results.append(fastxor.xor64(mv1[i:i+chunk_size], mv2[i:i+chunk_size]))
+        
+        chunked_time = time.time() - start_time
+        print(f"Time: {chunked_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / chunked_time:.2f} MB/s")
+        
+        if b"".join(chunked_results) == python_result:
+            print("✓ Results verified - identical to Python implementation")
+            speedup = python_time / chunked_time
+            print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
+        else:
+            print("❌ Results don't match Python implementation!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        chunked_time = float('inf')
+    
+    print()
+    
+    # Test 5b: FastXOR in-place, chunk at a time with one reusable output buffer
+    print("=== Test 5b: FastXOR xor_into() (chunked, reused output) ===")
+    out = bytearray(chunk_size)
+    start_time = time.time()
+    
+    try:
+        for i in range(0, mb_size, chunk_size):
+            fastxor.xor_into(out, mv1[i:i+chunk_size], mv2[i:i+chunk_size])
+        
+        into_time = time.time() - start_time
+        print(f"Time: {into_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / into_time:.2f} MB/s")
+        
+        # Verify outside the timed loop, since the buffer is overwritten per chunk
+        into_ok = True
+        for i in range(0, mb_size, chunk_size):
+            fastxor.xor_into(out, mv1[i:i+chunk_size], mv2[i:i+chunk_size])
+            if out != python_result[i:i+chunk_size]:
+                into_ok = False
+                break
+        if into_ok:
+            print("✓ Results verified - identical to Python implementation")
+            speedup = python_time / into_time
+            print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
+        else:
+            print("❌ Results don't match Python implementation!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        into_time = float('inf')
+    
+    print()
+    
+    # Test 5c: FastXOR chunked results as a list, built entirely in C
+    print("=== Test 5c: FastXOR xor_chunks() (list of chunks, one call) ===")
+    start_time = time.time()
+    
+    try:
+        chunks_result = fastxor.xor_chunks(data1, data2, chunk_size)
+        
+        chunks_time = time.time() - start_time
+        print(f"Time: {chunks_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / chunks_time:.2f} MB/s")
+        
+        if len(chunks_result) == mb_size // chunk_size and b"".join(chunks_result) == python_result:
+            print("✓ Results verified - identical to Python implementation")
+            speedup = python_time / chunks_time
+            print(f"🚀 Speedup: {speedup:.2f}x faster than Python")
+        else:
+            print("❌ Results don't match Python implementation!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        chunks_time = float('inf')
+    
+    print()
+    
+    # Test 6: Folding many buffers, chained xor() vs fused xor_reduce()
+    fold_count = 8
+    print(f"=== Test 6: FastXOR xor_reduce() ({fold_count} buffers, fused) ===")
+    fold_inputs = [data1, data2] + [os.urandom(mb_size) for _ in range(fold_count - 2)]
+    fold_mb = fold_count * mb_size / (1024*1024)
+    
+    start_time = time.time()
+    chained_result = fold_inputs[0]
+    for buf in fold_inputs[1:]:
+        chained_result = fastxor.xor(chained_result, buf)
+    chained_time = time.time() - start_time
+    print(f"Chained xor():  {chained_time:.4f} seconds ({fold_mb / chained_time:.2f} MB/s of input)")
+    
+    try:
+        start_time = time.time()
+        reduce_result = fastxor.xor_reduce(fold_inputs)
+        reduce_time = time.time() - start_time
+        print(f"xor_reduce():   {reduce_time:.4f} seconds ({fold_mb / reduce_time:.2f} MB/s of input)")
+        
+        if reduce_result == chained_result:
+            print("✓ Results verified - identical to chained xor()")
+            print(f"🚀 Speedup: {chained_time / reduce_time:.2f}x faster than chained xor()")
+        else:
+            print("❌ Results don't match chained xor()!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    print()
+    
+    # Test 7: Repeating 4-byte key (websocket mask), tiled key vs xor_key()
+    print("=== Test 7: FastXOR xor_key() (4-byte repeating key) ===")
+    mask = os.urandom(4)
+    
+    start_time = time.time()
+    tiled_result = fastxor.xor(data1, mask * (mb_size // len(mask)))
+    tiled_time = time.time() - start_time
+    print(f"xor() with tiled key: {tiled_time:.4f} seconds")
+    
+    try:
+        start_time = time.time()
+        key_result = fastxor.xor_key(data1, mask)
+        key_time = time.time() - start_time
+        print(f"xor_key():            {key_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / key_time:.2f} MB/s")
+        
+        if key_result == tiled_result:
+            print("✓ Results verified - identical to xor() with a tiled key")
+            print(f"🚀 Speedup: {tiled_time / key_time:.2f}x faster than tiling the key")
+        else:
+            print("❌ Results don't match xor() with a tiled key!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    print()
+    
+    # Test 8: Many equal-size chunks, per-row xor() vs packed xor_matrix()
+    rowlen = 4096
+    nrows = mb_size // rowlen
+    print(f"=== Test 8: FastXOR xor_matrix() ({nrows} rows x {rowlen} bytes, packed) ===")
+    # data1/data2 are already the packed row-major form of these row lists
+    rows1 = [data1[r * rowlen:(r + 1) * rowlen] for r in range(nrows)]
+    rows2 = [data2[r * rowlen:(r + 1) * rowlen] for r in range(nrows)]
+    
+    start_time = time.time()
+    row_results = [fastxor.xor(a, b) for a, b in zip(rows1, rows2)]
+    rows_time = time.time() - start_time
+    print(f"Per-row xor():  {rows_time:.4f} seconds")
+    
+    try:
+        start_time = time.time()
+        matrix_result = fastxor.xor_matrix(data1, data2, nrows, rowlen)
+        matrix_time = time.time() - start_time
+        print(f"xor_matrix():   {matrix_time:.4f} seconds")
+        print(f"Throughput: {(mb_size / (1024*1024)) / matrix_time:.2f} MB/s")
+        
+        if matrix_result == b"".join(row_results):
+            print("✓ Results verified - identical to per-row xor()")
+            print(f"🚀 Speedup: {rows_time / matrix_time:.2f}x faster than per-row xor()")
+        else:
+            print("❌ Results don't match per-row xor()!")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+    
+    print()
+    
     # Summary
     print("=== Performance Summary ===")
     print(f"Python byte-wise:    {(mb_size / (1024*1024)) / python_time:.2f} MB/s")
+    print(f"Python int XOR:      {(mb_size / (1024*1024)) / int_time:.2f} MB/s")
+    if numpy_time != float('inf'):
+        print(f"NumPy XOR:           {(mb_size / (1024*1024)) / numpy_time:.2f} MB/s")
+    if numba_time != float('inf'):
+        print(f"Numba XOR:           {(mb_size / (1024*1024)) / numba_time:.2f} MB/s")
     if fastxor_time != float('inf'):
         print(f"FastXOR xor64():     {(mb_size / (1024*1024)) / fastxor_time:.2f} MB/s")
         print(f"FastXOR xor():       {(mb_size / (1024*1024)) / flexible_time:.2f} MB/s")
+        print(f"FastXOR xor_many():  {(mb_size / (1024*1024)) / batched_time:.2f} MB/s")
+        print(f"FastXOR xor64() chunked: {(mb_size / (1024*1024)) / chunked_time:.2f} MB/s")
+        print(f"FastXOR xor_into():  {(mb_size / (1024*1024)) / into_time:.2f} MB/s")
+        print(f"FastXOR xor_chunks(): {(mb_size / (1024*1024)) / chunks_time:.2f} MB/s")
         print()
-        print(f"Best improvement:    {max(python_time / fastxor_time, python_time / flexible_time):.2f}x")
+        best_time = min(fastxor_time, flexible_time, batched_time, chunked_time, into_time, chunks_time)
+        print(f"Best improvement:    {python_time / best_time:.2f}x")
     print()
     
     # Test edge cases
     print("=== Edge Case Tests ===")
     
-    # Test small data (should fail for xor64)
+    # Test small data (xor64 no longer requires 8-byte multiples)
     small_data = b"1234567"  # 7 bytes
     try:
-        fastxor.xor64(small_data, small_data)
-        print("❌ xor64() should have failed on 7-byte data")
+        if fastxor.xor64(small_data, b"abcdefg") == fastxor.xor(small_data, b"abcdefg"):
+            print("✓ xor64() handles 7-byte data like xor()")
+        else:
+            print("❌ xor64() produced incorrect result for 7-byte data")
     except ValueError as e:
-        print(f"✓ xor64() correctly rejected 7-byte data: {e}")
+        print(f"❌ xor64() rejected 7-byte data: {e}")
     
     # Test mismatched sizes
     try:
@@ -143,6 +461,111 @@ def test_fastxor_performance():
     except ValueError as e:
         print(f"✓ xor64() correctly rejected mismatched sizes: {e}")
     
+    # Test batched function with a chunk size that doesn't divide the data
+    try:
+        fastxor.xor_many(b"12345678" * 3, b"abcdefgh" * 3, 16)
+        print("❌ xor_many() should have failed on 24 bytes with 16-byte chunks")
+    except ValueError as e:
+        print(f"✓ xor_many() correctly rejected partial chunk: {e}")
+    
+    # Test batched function with a chunk size that isn't a multiple of 8
+    if fastxor.xor_many(b"123456789", b"abcdefghi", 3) == fastxor.xor(b"123456789", b"abcdefghi"):
+        print("✓ xor_many() handles 3-byte chunks correctly")
+    else:
+        print("❌ xor_many() produced incorrect result for 3-byte chunks")
+    
+    # Test chunk list with a short final chunk
+    chunks = fastxor.xor_chunks(b"123456789", b"abcdefghi", 4)
+    if [len(c) for c in chunks] == [4, 4, 1] and b"".join(chunks) == fastxor.xor(b"123456789", b"abcdefghi"):
+        print("✓ xor_chunks() returns a short final chunk correctly")
+    else:
+        print("❌ xor_chunks() produced incorrect chunks for 9 bytes with 4-byte chunks")
+    
+    # Test in-place function with a read-only output
+    try:
+        fastxor.xor_into(bytes(8), b"12345678", b"abcdefgh")
+        print("❌ xor_into() should have failed on a read-only output")
+    except TypeError as e:
+        print(f"✓ xor_into() correctly rejected read-only output: {e}")
+    
+    # Test in-place function with a wrongly sized output
+    try:
+        fastxor.xor_into(bytearray(7), b"12345678", b"abcdefgh")
+        print("❌ xor_into() should have failed on a 7-byte output for 8-byte inputs")
+    except ValueError as e:
+        print(f"✓ xor_into() correctly rejected mismatched output size: {e}")
+    
+    # Test mixed buffer types (bytes, bytearray, memoryview)
+    try:
+        result = fastxor.xor(bytearray(b"Hello, World!"), memoryview(b"Secret Key123"))
+        if result == bytes(a ^ b for a, b in zip(b"Hello, World!", b"Secret Key123")):
+            print("✓ xor() accepts bytearray and memoryview inputs")
+        else:
+            print("❌ xor() produced incorrect result for bytearray/memoryview inputs")
+    except Exception as e:
+        print(f"❌ xor() failed on bytearray/memoryview inputs: {e}")
+    
+    # Test non-contiguous buffer (strided memoryview can't be read in place)
+    try:
+        fastxor.xor(memoryview(data1)[:16:2], memoryview(data2)[:16:2])
+        print("❌ xor() should have failed on a non-contiguous memoryview")
+    except (TypeError, BufferError) as e:
+        print(f"✓ xor() correctly rejected non-contiguous memoryview: {e}")
+    
+    # Test fused reduce with mismatched lengths
+    try:
+        fastxor.xor_reduce([b"12345678", b"abcdefgh", b"1234567"])
+        print("❌ xor_reduce() should have failed on mismatched sizes")
+    except ValueError as e:
+        print(f"✓ xor_reduce() correctly rejected mismatched sizes: {e}")
+    
+    # Test repeating key with a length that doesn't divide 64
+    key = b"Key12"
+    result = fastxor.xor_key(b"Hello, World!", key)
+    expected = bytes(c ^ key[i % len(key)] for i, c in enumerate(b"Hello, World!"))
+    if result == expected:
+        print("✓ xor_key() handles a 5-byte key correctly")
+    else:
+        print("❌ xor_key() produced incorrect result for a 5-byte key")
+    
+    # Test repeating key with an empty key
+    try:
+        fastxor.xor_key(b"12345678", b"")
+        print("❌ xor_key() should have failed on an empty key")
+    except ValueError as e:
+        print(f"✓ xor_key() correctly rejected empty key: {e}")
+    
+    # Test matrix whose buffers don't match nrows * rowlen
+    try:
+        fastxor.xor_matrix(b"12345678", b"abcdefgh", 3, 3)
+        print("❌ xor_matrix() should have failed on a size mismatch")
+    except ValueError as e:
+        print(f"✓ xor_matrix() correctly rejected size mismatch: {e}")
+    
+    # Test concurrent calls on large buffers (these run with the GIL released)
+    thread_results = [None] * 4
+    
+    def worker(slot):
+        thread_results[slot] = fastxor.xor(data1, data2)
+    
+    threads = [threading.Thread(target=worker, args=(slot,)) for slot in range(len(thread_results))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if all(r == python_result for r in thread_results):
+        print(f"✓ xor() gives correct results from {len(threads)} concurrent threads")
+    else:
+        print("❌ xor() produced incorrect results when called from multiple threads")
+    
+    # Test NumPy fallback on a length with a non-word tail
+    if np is not None:
+        odd1, odd2 = os.urandom(1003), os.urandom(1003)
+        if xor_numpy(odd1, odd2) == fastxor.xor(odd1, odd2):
+            print("✓ xor_numpy() handles a 1003-byte input with a 3-byte tail")
+        else:
+            print("❌ xor_numpy() produced incorrect result for a non-multiple of 8")
+    
     # Test flexible function with small data
     try:
         result = fastxor.xor(small_data, small_data)
@@ -166,7 +589,7 @@ To integrate fastxor into your existing performance test, add this function:
 def xor_chunk_fastxor(chunk1, chunk2):
     '''Ultra-fast C extension XOR'''
     import fastxor
-    return fastxor.xor64(chunk1, chunk2)  # or fastxor.xor() for flexibility
+    return fastxor.xor(chunk1, chunk2)  # any size, no alignment needed
 
 Then add a new test section:
 
@@ -174,10 +597,8 @@ Then add a new test section:
 print("=== TEST 3: FastXOR C Extension ===")
 start_time = time.time()
 
-fastxor_result_chunks = []
-for chunk1, chunk2 in zip(chunks1, chunks2):
-    xor_chunk = xor_chunk_fastxor(chunk1, chunk2)
-    fastxor_result_chunks.append(xor_chunk)
+# XOR the whole buffer in one call rather than slicing it into chunks first
+fastxor_result = fastxor.xor(data1, data2)
 
 fastxor_time = time.time() - start_time
 print(f"FastXOR time: {fastxor_time:.4f} seconds")
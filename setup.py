@@ -19,7 +19,6 @@ fastxor_extension = Extension(
     sources=['fastxor.c'],
     extra_compile_args=[
         '-O3',              # Maximum optimization
-        '-march=native',    # Optimize for current CPU architecture
         '-std=c99',         # Use C99 standard
         '-Wall',            # Enable all warnings
         '-Wextra',          # Extra warnings
@@ -47,7 +46,7 @@ setup(
         'Documentation': 'https://github.com/yourorg/fastxor/blob/main/README.md',
     },
     ext_modules=[fastxor_extension],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     keywords=['xor', 'cryptography', 'performance', 'bitwise', 'crypto', 'stream-cipher'],
     classifiers=[
         # Development Status
@@ -63,7 +62,6 @@ setup(
         
         # Programming Languages
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
@@ -119,6 +117,14 @@ setup(
             'matplotlib>=3.0',
             'numpy>=1.18',
         ],
+        # Vectorized XOR fallback for machines without a C toolchain
+        'numpy': [
+            'numpy>=1.18',
+        ],
+        # JIT-compiled, multi-threaded XOR fallback (also needs no C toolchain)
+        'numba': [
+            'numba>=0.50',
+        ],
     },
     
     # Test suite
@@ -146,8 +152,7 @@ if __name__ == '__main__':
     print()
     print("Quick start:")
     print("  >>> import fastxor")
-    print("  >>> result = fastxor.xor64(data1, data2)  # For aligned data")
-    print("  >>> result = fastxor.xor(data1, data2)    # For any size data")
+    print("  >>> result = fastxor.xor(data1, data2)    # Any size data")
     print("  >>> info = fastxor.get_info()             # Implementation details")
     print()
     print("Performance:")